@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import shutil
-
 from textual.app import App
 
+from krakenbuster.tools import check_tools
 from krakenbuster.screens.welcome import WelcomeScreen
 from krakenbuster.screens.scan_type import ScanTypeScreen
 from krakenbuster.screens.tool_select import ToolSelectScreen
@@ -13,16 +12,7 @@ from krakenbuster.screens.target import TargetScreen
 from krakenbuster.screens.wordlist import WordlistScreen
 from krakenbuster.screens.options import OptionsScreen
 from krakenbuster.screens.confirm import ConfirmScreen
-
-
-TOOLS = ["feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch", "amass", "subfinder"]
-
-# Which tools support which modes
-TOOL_SUPPORT = {
-    "directory": ["feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch"],
-    "vhost": ["ffuf", "gobuster", "wfuzz"],
-    "dns": ["gobuster", "amass", "subfinder"],
-}
+from krakenbuster.wordlist import WordlistDir, WordlistFile
 
 
 class KrakenBusterApp(App):
@@ -38,12 +28,16 @@ class KrakenBusterApp(App):
     target: str = ""
     wordlist_path: str = ""
     scan_options: dict[str, str] = {}
+    # Built commands and their display strings, keyed by
+    # (tool, scan type, target, wordlist, options)
+    command_cache: dict[tuple, tuple[tuple[str, ...], str]] = {}
+    # Discovered wordlist directories and their flattened files, kept for
+    # the rest of the session once the first discovery finishes
+    wordlist_cache: tuple[list[WordlistDir], list[WordlistFile]] | None = None
 
     def on_mount(self) -> None:
         """Check tool availability and push the welcome screen."""
-        self.available_tools = {
-            tool: shutil.which(tool) is not None for tool in TOOLS
-        }
+        self.available_tools = check_tools()
         self.push_screen(WelcomeScreen())
 
     def action_quit_app(self) -> None:
@@ -25,9 +25,25 @@ DEFAULTS = {
     },
 }
 
+# Parsed configuration shared across calls, and the config file mtime it was
+# read at. Reloaded if the file changes on disk.
+_cached: configparser.ConfigParser | None = None
+_cached_mtime: float | None = None
+
+
+def _config_mtime() -> float | None:
+    try:
+        return CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return None
+
 
 def load_config() -> configparser.ConfigParser:
     """Load configuration from ~/.krakenbuster.conf, creating defaults if needed."""
+    global _cached, _cached_mtime
+    if _cached is not None and _cached_mtime == _config_mtime():
+        return _cached
+
     config = configparser.ConfigParser()
 
     for section, values in DEFAULTS.items():
@@ -50,13 +66,18 @@ def load_config() -> configparser.ConfigParser:
         save_config(config)
         print(f"Created default configuration at {CONFIG_PATH}")
 
+    _cached = config
+    _cached_mtime = _config_mtime()
     return config
 
 
 def save_config(config: configparser.ConfigParser) -> None:
     """Write configuration to ~/.krakenbuster.conf."""
+    global _cached, _cached_mtime
     with open(CONFIG_PATH, "w") as fh:
         config.write(fh)
+    _cached = config
+    _cached_mtime = _config_mtime()
 
 
 def update_config(section: str, key: str, value: str) -> None:
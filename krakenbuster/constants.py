@@ -0,0 +1,15 @@
+"""Tool names and scan mode support shared across KrakenBuster."""
+
+from __future__ import annotations
+
+# Every wrapped tool, in display order
+TOOLS: tuple[str, ...] = (
+    "feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch", "amass", "subfinder",
+)
+
+# Which tools support which modes, in display order
+TOOL_SUPPORT: dict[str, tuple[str, ...]] = {
+    "directory": ("feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch"),
+    "vhost": ("ffuf", "gobuster", "wfuzz"),
+    "dns": ("gobuster", "amass", "subfinder"),
+}
@@ -7,8 +7,8 @@ Entry point with Click CLI handling for both interactive and non-interactive mod
 from __future__ import annotations
 
 import asyncio
+import inspect
 import os
-import shutil
 import sys
 import time
 
@@ -16,26 +16,77 @@ import click
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from krakenbuster.config import load_config, update_config
+from krakenbuster.constants import TOOLS, TOOL_SUPPORT
 from krakenbuster.output import (
     Finding,
+    RawOutputWriter,
     ScanResult,
     generate_output_paths,
-    append_raw_line,
     write_json_results,
     parse_finding,
 )
-from krakenbuster.scanners.base import create_scanner
+from krakenbuster.scanners.base import (
+    create_scanner,
+    iter_stream_batches,
+    iter_stream_lines,
+)
+from krakenbuster.tools import check_tools
 
 
 console = Console()
 
-TOOLS = ["feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch", "amass", "subfinder"]
+# Non-finding lines are printed in batches of up to this many lines, or
+# after this many seconds, whichever comes first.
+_CONSOLE_BATCH_LINES = 32
+_CONSOLE_BATCH_SECONDS = 0.05
 
+# Stdout batches with at least this many lines are parsed in a worker thread
+# so the event loop can keep draining stderr meanwhile. Smaller batches are
+# parsed inline, where the thread hand-off would cost more than it saves.
+_EXECUTOR_MIN_LINES = 256
 
-def check_tools() -> dict[str, bool]:
-    """Check which tools are available on the system."""
-    return {tool: shutil.which(tool) is not None for tool in TOOLS}
+
+def _parse_batch(
+    lines: list[bytes],
+) -> list[tuple[bytes, str, Finding | None]]:
+    """Strip, decode and parse a batch of raw stdout lines, dropping blank ones.
+
+    Lines go through the same str parser as the TUI, so both find the same
+    results in the same tool output.
+    """
+    parsed = []
+    for raw_line in lines:
+        raw_bytes = raw_line.rstrip()
+        if raw_bytes:
+            line = raw_bytes.decode("utf-8", errors="replace")
+            parsed.append((raw_bytes, line, parse_finding(line)))
+    return parsed
+
+
+def _run_async(coro) -> None:
+    """Run a coroutine to completion, on uvloop when it is available."""
+    if uvloop is not None:
+        uvloop.run(coro)
+    else:
+        asyncio.run(coro)
+
+
+def _run_app(app):
+    """Run the TUI to completion, on uvloop when it is available."""
+    # App.run only takes a loop from Textual 4.0; older releases use asyncio's
+    if uvloop is None or "loop" not in inspect.signature(app.run).parameters:
+        return app.run()
+    loop = uvloop.new_event_loop()
+    try:
+        return app.run(loop=loop)
+    finally:
+        loop.close()
 
 
 def _execute_commands(commands: list[list[str]]) -> None:
@@ -80,45 +131,71 @@ async def run_cli_scan(
         wordlist=wordlist,
     )
 
-    start_time = time.time()
-
-    process = await asyncio.create_subprocess_exec(
-        *command,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-
-    assert process.stdout is not None
-    assert process.stderr is not None
+    # Raw output goes to disk from a background thread, so the read loop
+    # only waits when the disk falls well behind. Opened first so a bad
+    # path fails before the tool starts.
+    raw_writer = RawOutputWriter(raw_path)
+    raw_writer.start()
+
+    start_time = time.monotonic()
+    loop = asyncio.get_running_loop()
+    pending: list[str] = []
+    flush_handle: asyncio.TimerHandle | None = None
+
+    def flush_pending() -> None:
+        nonlocal flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        if pending:
+            console.print("\n".join(pending), style="dim", markup=False)
+            pending.clear()
 
     async def read_stdout() -> None:
-        async for raw_line in process.stdout:
-            line = raw_line.decode("utf-8", errors="replace").rstrip()
-            if not line:
-                continue
-
-            result.raw_lines.append(line)
-            await append_raw_line(raw_path, line)
-
-            finding = parse_finding(line)
-            if finding:
-                result.findings.append(finding)
-                status = finding.status_code
-                colour = _status_colour(status)
-                console.print(f"[{colour}][{status}][/{colour}] {line}")
+        nonlocal flush_handle
+        async for lines in iter_stream_batches(process.stdout):
+            if len(lines) >= _EXECUTOR_MIN_LINES:
+                parsed = await loop.run_in_executor(None, _parse_batch, lines)
             else:
-                console.print(f"[dim]{line}[/dim]")
+                parsed = _parse_batch(lines)
+            # One queued write per batch keeps the writer's queue bound cheap
+            await raw_writer.write(b"".join([raw_bytes + b"\n" for raw_bytes, _, _ in parsed]))
+            for _, line, finding in parsed:
+                if finding:
+                    result.findings.append(finding)
+                    # Keep output in order: print any batched lines first
+                    flush_pending()
+                    status = finding.status_code
+                    colour = _status_colour(status)
+                    console.print(f"[{colour}][{status}][/{colour}] {line}")
+                else:
+                    pending.append(line)
+                    if len(pending) >= _CONSOLE_BATCH_LINES:
+                        flush_pending()
+                    elif flush_handle is None:
+                        flush_handle = loop.call_later(_CONSOLE_BATCH_SECONDS, flush_pending)
+        flush_pending()
 
     async def read_stderr() -> None:
-        async for raw_line in process.stderr:
+        async for raw_line in iter_stream_lines(process.stderr):
             line = raw_line.decode("utf-8", errors="replace").rstrip()
             if line:
                 result.stderr_lines.append(line)
 
-    await asyncio.gather(read_stdout(), read_stderr())
-    await process.wait()
-
-    result.duration_seconds = time.time() - start_time
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        assert process.stdout is not None
+        assert process.stderr is not None
+        await asyncio.gather(read_stdout(), read_stderr())
+        await process.wait()
+    finally:
+        await asyncio.to_thread(raw_writer.close)
+
+    result.duration_seconds = time.monotonic() - start_time
     await write_json_results(json_path, result.findings)
 
     # Print summary
@@ -143,21 +220,19 @@ async def run_cli_scan(
 
     if result.stderr_lines:
         console.print("\n[bold red]Warnings/Errors:[/bold red]")
-        for line in result.stderr_lines[-10:]:
+        for line in list(result.stderr_lines)[-10:]:
             console.print(f"  [red]{line}[/red]")
 
 
+_STATUS_COLOURS: dict[int, str] = {200: "green"}
+_STATUS_COLOURS.update(dict.fromkeys((301, 302, 307), "yellow"))
+_STATUS_COLOURS.update(dict.fromkeys((401, 403), "cyan"))
+
+
 def _status_colour(code: int) -> str:
     """Return a Rich colour name for an HTTP status code."""
-    if code == 200:
-        return "green"
-    elif code in (301, 302, 307):
-        return "yellow"
-    elif code in (401, 403):
-        return "cyan"
-    elif code >= 500:
-        return "red"
-    return "white"
+    # Codes not in the table (404, 204, 405, ...) are white, or red from 500 up
+    return _STATUS_COLOURS.get(code, "red" if code >= 500 else "white")
 
 
 def _common_options(func):
@@ -182,7 +257,7 @@ def cli(ctx: click.Context) -> None:
     if ctx.invoked_subcommand is None:
         from krakenbuster.app import KrakenBusterApp
         app = KrakenBusterApp()
-        result = app.run()
+        result = _run_app(app)
 
         if result and isinstance(result, list):
             _execute_commands(result)
@@ -216,11 +291,11 @@ def dir(tool, url, wordlist, threads, rate, proxy, extensions, output_dir,
         "filter_size": filter_size,
     }
 
-    asyncio.run(run_cli_scan("directory", tool, url, wordlist, options))
+    _run_async(run_cli_scan("directory", tool, url, wordlist, options))
 
 
 @cli.command()
-@click.option("--tool", required=True, type=click.Choice(["ffuf", "gobuster", "wfuzz"]), help="Scanner tool to use")
+@click.option("--tool", required=True, type=click.Choice(TOOL_SUPPORT["vhost"]), help="Scanner tool to use")
 @click.option("--target", required=True, help="Target URL or IP")
 @click.option("--domain", required=True, help="Base domain for Host header")
 @_common_options
@@ -243,11 +318,11 @@ def vhost(tool, target, domain, wordlist, threads, rate, proxy, extensions,
         "filter_size": filter_size,
     }
 
-    asyncio.run(run_cli_scan("vhost", tool, target, wordlist, options))
+    _run_async(run_cli_scan("vhost", tool, target, wordlist, options))
 
 
 @cli.command()
-@click.option("--tool", required=True, type=click.Choice(["gobuster", "amass", "subfinder"]), help="Scanner tool to use")
+@click.option("--tool", required=True, type=click.Choice(TOOL_SUPPORT["dns"]), help="Scanner tool to use")
 @click.option("--domain", required=True, help="Target domain")
 @_common_options
 @click.option("--resolver", default="", help="Custom DNS resolver")
@@ -266,7 +341,7 @@ def dns(tool, domain, wordlist, threads, rate, proxy, extensions, output_dir,
         "show_ips": str(show_ips).lower(),
     }
 
-    asyncio.run(run_cli_scan("dns", tool, domain, wordlist, options))
+    _run_async(run_cli_scan("dns", tool, domain, wordlist, options))
 
 
 @cli.command(name="__main__", hidden=True)
@@ -274,7 +349,7 @@ def main_entry():
     """Support python -m krakenbuster."""
     from krakenbuster.app import KrakenBusterApp
     app = KrakenBusterApp()
-    result = app.run()
+    result = _run_app(app)
     if result and isinstance(result, list):
         _execute_commands(result)
 
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import queue
 import re
-from dataclasses import dataclass, field, asdict
+import string
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import aiofiles
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Most recent stderr lines kept on a ScanResult for the summary
+STDERR_TAIL_LINES = 64
+
+
+@dataclass(slots=True)
 class Finding:
     """A single finding from a scan."""
 
@@ -23,7 +37,7 @@ class Finding:
     redirect: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Aggregated results from a scan."""
 
@@ -34,9 +48,21 @@ class ScanResult:
     total_words: int = 0
     duration_seconds: float = 0.0
     findings: list[Finding] = field(default_factory=list)
-    raw_lines: list[str] = field(default_factory=list)
-    stderr_lines: list[str] = field(default_factory=list)
+    stderr_lines: deque[str] = field(
+        default_factory=lambda: deque(maxlen=STDERR_TAIL_LINES)
+    )
     errors: int = 0
+    raw_path: Path | None = None
+    json_path: Path | None = None
+    vhost_raw_path: Path | None = None
+    vhost_json_path: Path | None = None
+    _by_status: dict[int, list[Finding]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Rendered findings breakdown, filled in by the summary screen
+    _summary_markup: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def duration_formatted(self) -> str:
@@ -46,16 +72,36 @@ class ScanResult:
 
     @property
     def findings_by_status(self) -> dict[int, list[Finding]]:
-        grouped: dict[int, list[Finding]] = {}
-        for f in self.findings:
-            grouped.setdefault(f.status_code, []).append(f)
-        return grouped
+        """Findings grouped by status code.
+
+        Grouped on first access and reused afterwards, so only read this once
+        the scan has finished adding findings.
+        """
+        if self._by_status is None:
+            grouped: dict[int, list[Finding]] = {}
+            for f in self.findings:
+                grouped.setdefault(f.status_code, []).append(f)
+            self._by_status = grouped
+        return self._by_status
+
+
+_SCHEME_RE = re.compile(r"https?://")
+_HOSTNAME_KEEP = frozenset(string.ascii_letters + string.digits)
+_HOSTNAME_TRANS = str.maketrans(
+    {chr(c): "_" for c in range(128) if chr(c) not in _HOSTNAME_KEEP}
+)
 
 
 def sanitise_hostname(target: str) -> str:
     """Sanitise a hostname for use in filenames."""
-    cleaned = re.sub(r"https?://", "", target)
-    cleaned = re.sub(r"[^a-zA-Z0-9]", "_", cleaned)
+    cleaned = target.removeprefix("https://").removeprefix("http://")
+    if "://" in cleaned:
+        # Rare: a scheme embedded further along the target
+        cleaned = _SCHEME_RE.sub("", target)
+    if not cleaned.isascii():
+        # Each non-ASCII character becomes "?", which the table maps to "_"
+        cleaned = cleaned.encode("ascii", errors="replace").decode("ascii")
+    cleaned = cleaned.translate(_HOSTNAME_TRANS)
     cleaned = cleaned.strip("_")
     return cleaned
 
@@ -76,36 +122,184 @@ def generate_output_paths(
     return raw_path, json_path
 
 
-async def append_raw_line(path: Path, line: str) -> None:
-    """Append a single line to the raw output file."""
-    async with aiofiles.open(path, "a") as fh:
-        await fh.write(line + "\n")
+# Writes the raw output thread may fall behind by before write() waits
+_RAW_QUEUE_MAX = 1024
+
+
+class RawOutputWriter:
+    """Append raw output to a file from a dedicated background thread.
+
+    The file is opened here, so a bad path fails in the caller. Once the
+    queue is full, write() waits (without blocking the event loop) for the
+    thread to catch up, holding the reader to the disk's pace; a write
+    error is raised again by close().
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # Stays open for the whole scan
+        self._fh = open(path, "ab", buffering=64 * 1024)
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=_RAW_QUEUE_MAX)
+        self._error: OSError | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    async def write(self, data: bytes) -> None:
+        """Queue bytes to be appended to the file."""
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, data)
+
+    def close(self) -> None:
+        """Flush everything queued so far and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        with self._fh as fh:
+            while (data := self._queue.get()) is not None:
+                if self._error is not None:
+                    # Keep draining so write() never waits on a dead file
+                    continue
+                try:
+                    fh.write(data)
+                except OSError as exc:
+                    self._error = exc
+
+
+# Findings serialised per write when streaming JSON results
+_JSON_BATCH = 1000
+
+
+def _dump_json(obj: dict) -> bytes:
+    """Serialise a single record compactly, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _finding_record(finding: Finding) -> dict:
+    """Build the JSON record for a finding."""
+    return {
+        "status_code": finding.status_code,
+        "url": finding.url,
+        "size": finding.size,
+        "words": finding.words,
+        "lines": finding.lines,
+        "redirect": finding.redirect,
+    }
 
 
 async def write_json_results(path: Path, findings: list[Finding]) -> None:
-    """Write findings as a JSON array."""
-    data = [asdict(f) for f in findings]
-    async with aiofiles.open(path, "w") as fh:
-        await fh.write(json.dumps(data, indent=2))
+    """Write findings as a JSON array, one record per line.
+
+    Records are serialised and written in batches, so peak memory is bounded
+    by the batch size rather than the total number of findings.
+    """
+    async with aiofiles.open(path, "wb") as fh:
+        await fh.write(b"[")
+        for start in range(0, len(findings), _JSON_BATCH):
+            batch = findings[start:start + _JSON_BATCH]
+            chunk = b",\n".join(_dump_json(_finding_record(f)) for f in batch)
+            await fh.write((b"\n" if start == 0 else b",\n") + chunk)
+        await fh.write(b"\n]" if findings else b"]")
+
+
+class _CodeBeforeUrl:
+    """Linear-time form of ``\\b(\\d{3})\\b.*\\bhttps?://``.
+
+    As a plain regex this backtracks quadratically on long lines whose digit
+    runs have no URL after them (carriage-return progress bars can be
+    megabytes long). Instead, find where the last URL starts with one
+    anchored match, then search for the code only in front of it.
+    """
+
+    def __init__(self) -> None:
+        self._last_url = re.compile(r"^.*(\bhttps?://)")
+        self._code = re.compile(r"\b(\d{3})\b")
+
+    def search(self, line: str) -> re.Match[str] | None:
+        url = self._last_url.match(line)
+        if url is None:
+            return None
+        return self._code.search(line, 0, url.start(1))
+
+
+# Common status code patterns across tools, ordered from most specific to least
+_STATUS_SOURCES = (
+    r"CODE:(\d{3})",                    # dirb: (CODE:200|SIZE:11297)
+    r"C=(\d{3})",                       # wfuzz/dirsearch style
+    r"Status:\s*(\d{3})",               # feroxbuster style
+    r"\[Status:\s*(\d{3})\]",           # bracketed status
+    r"\(Status:\s*(\d{3})\)",           # parenthesised status
+    r"^\s*(\d{3})\s",                   # line starts with status
+    _CodeBeforeUrl,                     # status code before URL
+    r"\b(\d{3})\s+\d+[A-Za-z]",        # status followed by size
+    r"\|\s*(\d{3})\s*\|",              # pipe-delimited
+)
+
+
+_STATUS_PATTERNS = tuple(
+    _CodeBeforeUrl() if source is _CodeBeforeUrl else re.compile(source)
+    for source in _STATUS_SOURCES
+)
+
+_URL_RE = re.compile(r"(https?://\S+)")
+_URL_CODE_TAIL_RE = re.compile(r"\s*\(CODE:.*")
+_URL_STATUS_TAIL_RE = re.compile(r"\s*\(Status:.*")
+
+_SIZE_PATTERNS: tuple[re.Pattern[str], ...] = tuple(re.compile(p) for p in (
+    r"SIZE:(\d+)",             # dirb: (CODE:200|SIZE:11297)
+    r"Size:\s*(\d+)",          # feroxbuster/ffuf style
+    r"\b(\d+)[Bb]\b",         # standalone byte count
+    r"\|\s*(\d+)\s*\|",       # pipe-delimited
+))
+
+_PROGRESS_PATTERNS: tuple[re.Pattern[str], ...] = tuple(re.compile(p) for p in (
+    # gobuster: "Progress: 1234 / 5000 (24.68%)"
+    r"Progress:\s*(\d+)\s*/\s*(\d+)",
+    # ffuf: ":: Progress: [1234/5000]"
+    r"Progress:\s*\[(\d+)/(\d+)\]",
+    # feroxbuster: "1234/5000"  or  "Scanned 1234/5000"
+    r"(?:Scanned\s+)?(\d+)/(\d+)",
+    # wfuzz: "Total requests: 5000" (only total, not progress)
+    # dirsearch: "45%" style
+))
+
+# dirsearch percentage: "45%"
+_PCT_RE = re.compile(r"\b(\d{1,3})%")
+
+_DIRB_DOWNLOADED_RE = re.compile(r"DOWNLOADED:\s*(\d+)")
+
+# Single-pass alternation covering the keyed status/size markers and the URL,
+# so parse_finding only walks the line once in the common case.
+_FINDING_RE = re.compile(
+    r"CODE:(?P<code>\d{3})"
+    r"|C=(?P<wfuzz_code>\d{3})"
+    r"|Status:\s*(?P<status_code>\d{3})"
+    r"|(?P<url>https?://\S+)"
+    r"|SIZE:(?P<size>\d+)"
+    r"|Size:\s*(?P<size_label>\d+)"
+)
+
+
+# Every status pattern needs three consecutive digits; lines without them
+# (banners, most progress noise) are rejected with this one scan.
+_DIGIT_RUN_RE = re.compile(r"\d{3}")
 
 
 def parse_status_code(line: str) -> int | None:
     """Extract HTTP status code from a tool output line."""
-    # Common patterns across tools, ordered from most specific to least
-    patterns = [
-        r"CODE:(\d{3})",                    # dirb: (CODE:200|SIZE:11297)
-        r"C=(\d{3})",                       # wfuzz/dirsearch style
-        r"Status:\s*(\d{3})",               # feroxbuster style
-        r"\[Status:\s*(\d{3})\]",           # bracketed status
-        r"\(Status:\s*(\d{3})\)",           # parenthesised status
-        r"^\s*(\d{3})\s",                   # line starts with status
-        r"\b(\d{3})\b.*\bhttps?://",        # status code before URL
-        r"\b(\d{3})\s+\d+[A-Za-z]",        # status followed by size
-        r"\|\s*(\d{3})\s*\|",              # pipe-delimited
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, line)
+    if not _DIGIT_RUN_RE.search(line):
+        return None
+    for pattern in _STATUS_PATTERNS:
+        match = pattern.search(line)
         if match:
             code = int(match.group(1))
             if 100 <= code <= 599:
@@ -113,42 +307,65 @@ def parse_status_code(line: str) -> int | None:
     return None
 
 
+def _clean_url(url: str) -> str:
+    """Strip trailing noise from a matched URL: parenthesised metadata, punctuation."""
+    url = _URL_CODE_TAIL_RE.sub("", url)
+    url = _URL_STATUS_TAIL_RE.sub("", url)
+    return url.rstrip(",;])(")
+
+
 def parse_url(line: str) -> str:
     """Extract URL from a tool output line."""
-    match = re.search(r"(https?://\S+)", line)
+    match = _URL_RE.search(line)
     if match:
-        url = match.group(1)
-        # Strip trailing noise: parenthesised metadata, punctuation
-        url = re.sub(r"\s*\(CODE:.*", "", url)
-        url = re.sub(r"\s*\(Status:.*", "", url)
-        url = url.rstrip(",;])(")
-        return url
+        return _clean_url(match.group(1))
     return ""
 
 
 def parse_size(line: str) -> int:
     """Extract response size from a tool output line."""
-    patterns = [
-        r"SIZE:(\d+)",             # dirb: (CODE:200|SIZE:11297)
-        r"Size:\s*(\d+)",          # feroxbuster/ffuf style
-        r"\b(\d+)[Bb]\b",         # standalone byte count
-        r"\|\s*(\d+)\s*\|",       # pipe-delimited
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, line)
+    for pattern in _SIZE_PATTERNS:
+        match = pattern.search(line)
         if match:
             return int(match.group(1))
     return 0
 
 
 def parse_finding(line: str) -> Finding | None:
-    """Parse a single output line into a Finding, if it contains one."""
-    status = parse_status_code(line)
-    if status is None:
+    """Parse a single output line into a Finding, if it contains one.
+
+    Keyed markers (CODE:, C=, Status:, SIZE:, Size:) and the URL are picked up
+    in one pass; lines without them fall back to the full pattern ladders.
+    """
+    if not _DIGIT_RUN_RE.search(line):
         return None
 
-    url = parse_url(line)
-    size = parse_size(line)
+    first: dict[str, str] = {}
+    for match in _FINDING_RE.finditer(line):
+        kind = match.lastgroup
+        if kind and kind not in first:
+            first[kind] = match.group(kind)
+
+    status = None
+    for kind in ("code", "wfuzz_code", "status_code"):
+        if kind in first:
+            code = int(first[kind])
+            if 100 <= code <= 599:
+                status = code
+                break
+    if status is None:
+        status = parse_status_code(line)
+        if status is None:
+            return None
+
+    url = _clean_url(first["url"]) if "url" in first else ""
+
+    if "size" in first:
+        size = int(first["size"])
+    elif "size_label" in first:
+        size = int(first["size_label"])
+    else:
+        size = parse_size(line)
 
     return Finding(
         status_code=status,
@@ -163,26 +380,15 @@ def parse_progress(line: str) -> tuple[int, int] | None:
     Returns (completed, total) if a progress indicator is found, else None.
     Supports: gobuster, ffuf, wfuzz, dirsearch, feroxbuster, dirb.
     """
-    patterns = [
-        # gobuster: "Progress: 1234 / 5000 (24.68%)"
-        r"Progress:\s*(\d+)\s*/\s*(\d+)",
-        # ffuf: ":: Progress: [1234/5000]"
-        r"Progress:\s*\[(\d+)/(\d+)\]",
-        # feroxbuster: "1234/5000"  or  "Scanned 1234/5000"
-        r"(?:Scanned\s+)?(\d+)/(\d+)",
-        # wfuzz: "Total requests: 5000" (only total, not progress)
-        # dirsearch: "45%" style
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, line)
+    for pattern in _PROGRESS_PATTERNS:
+        match = pattern.search(line)
         if match:
             completed = int(match.group(1))
             total = int(match.group(2))
             if total > 0 and completed <= total:
                 return (completed, total)
 
-    # dirsearch percentage: "45%"
-    pct_match = re.search(r"\b(\d{1,3})%", line)
+    pct_match = _PCT_RE.search(line)
     if pct_match:
         pct = int(pct_match.group(1))
         if 0 < pct <= 100:
@@ -193,7 +399,7 @@ def parse_progress(line: str) -> tuple[int, int] | None:
 
 def parse_dirb_downloaded(line: str) -> int | None:
     """Parse dirb's final DOWNLOADED count from output."""
-    match = re.search(r"DOWNLOADED:\s*(\d+)", line)
+    match = _DIRB_DOWNLOADED_RE.search(line)
     if match:
         return int(match.group(1))
     return None
@@ -1 +1,22 @@
 """KrakenBuster scanner implementations."""
+
+from krakenbuster.scanners.amass import AmassScanner
+from krakenbuster.scanners.base import SCANNERS
+from krakenbuster.scanners.dirb import DirbScanner
+from krakenbuster.scanners.dirsearch import DirsearchScanner
+from krakenbuster.scanners.feroxbuster import FeroxbusterScanner
+from krakenbuster.scanners.ffuf import FfufScanner
+from krakenbuster.scanners.gobuster import GobusterScanner
+from krakenbuster.scanners.subfinder import SubfinderScanner
+from krakenbuster.scanners.wfuzz import WfuzzScanner
+
+SCANNERS.update({
+    "feroxbuster": FeroxbusterScanner,
+    "ffuf": FfufScanner,
+    "gobuster": GobusterScanner,
+    "dirb": DirbScanner,
+    "wfuzz": WfuzzScanner,
+    "dirsearch": DirsearchScanner,
+    "amass": AmassScanner,
+    "subfinder": SubfinderScanner,
+})
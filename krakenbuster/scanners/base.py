@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
+import signal
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import AsyncIterator
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanLine:
     """A single line of output from a scanner."""
 
@@ -16,6 +20,74 @@ class ScanLine:
     is_stderr: bool = False
 
 
+# Bytes requested per pipe read when streaming subprocess output
+READ_CHUNK_SIZE = 64 * 1024
+
+# Longest partial line held while waiting for its newline; anything longer
+# (progress bars redrawn with bare carriage returns) is passed on in pieces
+_MAX_CARRY_BYTES = 1024 * 1024
+
+# Pipe reads (lists of lines) buffered between the readers and the consumer
+_QUEUE_SIZE = 16
+
+# Seconds a cancelled tool gets to exit after SIGTERM before it is killed
+_CANCEL_GRACE_SECONDS = 0.5
+
+# Run tools in their own session so cancel() can signal the whole group
+_NEW_SESSION = os.name == "posix"
+
+# Option strings treated as true by _get_opt_bool
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
+async def iter_stream_batches(
+    stream: asyncio.StreamReader, chunk_size: int = READ_CHUNK_SIZE
+) -> AsyncIterator[list[bytes]]:
+    """Yield the complete lines (without trailing newlines) of each chunk read.
+
+    Reads in large chunks and splits them here, rather than letting the
+    StreamReader scan for a newline and allocate once per line. A partial
+    line is carried to the next chunk; one that grows past _MAX_CARRY_BYTES
+    without a newline is yielded as it stands, so memory stays bounded.
+    """
+    carry = bytearray()
+    while chunk := await stream.read(chunk_size):
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            carry += chunk
+            if len(carry) >= _MAX_CARRY_BYTES:
+                yield [bytes(carry)]
+                carry.clear()
+            continue
+        if carry:
+            carry += chunk[:end]
+            data = bytes(carry)
+            carry.clear()
+        else:
+            data = chunk[:end]
+        yield data.split(b"\n")
+        carry += chunk[end + 1:]
+    if carry:
+        yield [bytes(carry)]
+
+
+async def iter_stream_lines(
+    stream: asyncio.StreamReader, chunk_size: int = READ_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield lines (without the trailing newline) from a stream."""
+    async for lines in iter_stream_batches(stream, chunk_size):
+        for line in lines:
+            yield line
+
+
+@functools.lru_cache(maxsize=32)
+def dot_extensions(extensions: str) -> str:
+    """Turn an extensions option like "php,.html" into ".php,.html"."""
+    return ",".join(
+        f".{e.strip('.')}" for e in extensions.split(",") if e.strip()
+    )
+
+
 class BaseScanner(ABC):
     """Abstract base class for all scanner implementations."""
 
@@ -30,6 +102,16 @@ class BaseScanner(ABC):
         self.target = target
         self.wordlist = wordlist
         self.options = options or {}
+        # Options pre-parsed once so the getters below are a single lookup
+        self._opts_bool: dict[str, bool] = {}
+        self._opts_int: dict[str, int] = {}
+        for key, val in self.options.items():
+            text = str(val)
+            self._opts_bool[key] = text.lower() in _TRUE_VALUES
+            try:
+                self._opts_int[key] = int(val)
+            except (ValueError, TypeError):
+                pass
         self._process: asyncio.subprocess.Process | None = None
 
     @property
@@ -47,49 +129,134 @@ class BaseScanner(ABC):
         """Run the scan and yield output lines as they arrive.
 
         Uses asyncio.create_subprocess_exec with piped stdout/stderr.
-        Reads stdout line by line without blocking the event loop.
+        Both pipes are read concurrently without blocking the event loop.
+        """
+        async for lines in self.run_scan_batched(batch=sys.maxsize):
+            for line in lines:
+                yield line
+
+    async def run_scan_batched(
+        self, batch: int = 64
+    ) -> AsyncIterator[list[ScanLine]]:
+        """Run the scan and yield output lines in batches of up to ``batch``.
+
+        Each batch holds whatever has already been read, so a busy scanner
+        yields full batches while a quiet one still yields single lines
+        promptly.
         """
-        command = self.build_command()
-
-        # Use a large line buffer limit (4MB) to handle tools like dirsearch
-        # that output ANSI progress bars using carriage returns without newlines,
-        # creating extremely long "lines" that exceed asyncio's default 64KB limit.
-        self._process = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            limit=4 * 1024 * 1024,
-        )
-
-        assert self._process.stdout is not None
-        assert self._process.stderr is not None
-
-        # Read stdout line by line
-        async for raw_line in self._process.stdout:
-            line = raw_line.decode("utf-8", errors="replace").rstrip()
-            if line:
-                yield ScanLine(raw=line, is_stderr=False)
-
-        # After stdout is done, read any remaining stderr
-        stderr_data = await self._process.stderr.read()
-        if stderr_data:
-            for line in stderr_data.decode("utf-8", errors="replace").splitlines():
-                if line.strip():
-                    yield ScanLine(raw=line.strip(), is_stderr=True)
-
-        await self._process.wait()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        producer = asyncio.create_task(self._produce(queue))
+        pending: list[ScanLine] = []
+        end: Exception | None = None
+        finished = False
+
+        def take(item: list[ScanLine] | Exception | None) -> bool:
+            nonlocal end
+            if isinstance(item, list):
+                pending.extend(item)
+                return False
+            end = item
+            return True
+
+        try:
+            while True:
+                # Only wait for output when nothing is left over
+                if not pending and not finished:
+                    finished = take(await queue.get())
+                while not finished and len(pending) < batch and not queue.empty():
+                    finished = take(queue.get_nowait())
+                if not pending:
+                    break
+                if len(pending) <= batch:
+                    lines, pending = pending, []
+                else:
+                    lines = pending[:batch]
+                    del pending[:batch]
+                yield lines
+        finally:
+            if not producer.done():
+                producer.cancel()
+
+        if end is not None:
+            raise end
+
+    async def _produce(self, queue: asyncio.Queue) -> None:
+        """Start the tool and queue its output.
+
+        Queues a list of ScanLines per pipe read, then None once the process
+        has exited. A failure to start or read is queued as the exception.
+        """
+        try:
+            command = self.build_command()
+
+            self._process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=_NEW_SESSION,
+            )
+
+            assert self._process.stdout is not None
+            assert self._process.stderr is not None
+
+            # Drain stderr alongside stdout; left unread, a chatty tool fills
+            # the stderr pipe and stalls before finishing its stdout.
+            await asyncio.gather(
+                self._pump(self._process.stdout, False, queue),
+                self._pump(self._process.stderr, True, queue),
+            )
+            await self._process.wait()
+        except Exception as exc:
+            await queue.put(exc)
+        await queue.put(None)
+
+    @staticmethod
+    async def _pump(
+        stream: asyncio.StreamReader, is_stderr: bool, queue: asyncio.Queue
+    ) -> None:
+        """Queue the non-blank lines of one pipe until it closes."""
+        # Lines are split out of 64 KiB reads. Tools like dirsearch that redraw
+        # progress bars with carriage returns and no newline produce very long
+        # "lines"; iter_stream_batches passes those on in bounded pieces.
+        strip = str.strip if is_stderr else str.rstrip
+        async for raw_lines in iter_stream_batches(stream):
+            # Decode the whole read at once; a newline never falls inside a
+            # UTF-8 sequence, so this matches decoding each line separately
+            text = b"\n".join(raw_lines).decode("utf-8", errors="replace")
+            lines = [
+                ScanLine(line, is_stderr)
+                for line in map(strip, text.split("\n"))
+                if line
+            ]
+            if lines:
+                await queue.put(lines)
 
     async def cancel(self) -> None:
         """Cancel the running scan."""
         if self._process and self._process.returncode is None:
             try:
-                self._process.terminate()
-                await asyncio.sleep(0.5)
-                if self._process.returncode is None:
-                    self._process.kill()
+                self._signal_tool(kill=False)
+                try:
+                    await asyncio.wait_for(
+                        self._process.wait(), timeout=_CANCEL_GRACE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    self._signal_tool(kill=True)
             except ProcessLookupError:
                 pass
 
+    def _signal_tool(self, kill: bool) -> None:
+        """Terminate (or kill) the tool and any processes it started."""
+        assert self._process is not None
+        if _NEW_SESSION:
+            # The tool leads its own process group (pgid == pid), so recursive
+            # scanners don't leave children running.
+            os.killpg(self._process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        elif kill:
+            self._process.kill()
+        else:
+            self._process.terminate()
+
     @property
     def return_code(self) -> int | None:
         """Return the process exit code, or None if still running."""
@@ -103,16 +270,16 @@ class BaseScanner(ABC):
 
     def _get_opt_int(self, key: str, default: int = 0) -> int:
         """Get an option value as an integer."""
-        val = self.options.get(key, str(default))
-        try:
-            return int(val)
-        except (ValueError, TypeError):
-            return default
+        return self._opts_int.get(key, default)
 
     def _get_opt_bool(self, key: str, default: bool = False) -> bool:
         """Get an option value as a boolean."""
-        val = self.options.get(key, str(default)).lower()
-        return val in ("true", "1", "yes", "on")
+        return self._opts_bool.get(key, default)
+
+
+# Tool name -> scanner class, filled by krakenbuster/scanners/__init__.py,
+# which Python always runs to completion before this module can be used
+SCANNERS: dict[str, type[BaseScanner]] = {}
 
 
 def create_scanner(
@@ -123,28 +290,9 @@ def create_scanner(
     options: dict[str, str] | None = None,
 ) -> BaseScanner:
     """Factory function to create the appropriate scanner instance."""
-    from krakenbuster.scanners.feroxbuster import FeroxbusterScanner
-    from krakenbuster.scanners.ffuf import FfufScanner
-    from krakenbuster.scanners.gobuster import GobusterScanner
-    from krakenbuster.scanners.dirb import DirbScanner
-    from krakenbuster.scanners.wfuzz import WfuzzScanner
-    from krakenbuster.scanners.dirsearch import DirsearchScanner
-    from krakenbuster.scanners.amass import AmassScanner
-    from krakenbuster.scanners.subfinder import SubfinderScanner
-
-    scanners: dict[str, type[BaseScanner]] = {
-        "feroxbuster": FeroxbusterScanner,
-        "ffuf": FfufScanner,
-        "gobuster": GobusterScanner,
-        "dirb": DirbScanner,
-        "wfuzz": WfuzzScanner,
-        "dirsearch": DirsearchScanner,
-        "amass": AmassScanner,
-        "subfinder": SubfinderScanner,
-    }
-
-    scanner_class = scanners.get(tool)
-    if scanner_class is None:
-        raise ValueError(f"Unknown tool: {tool}")
+    try:
+        scanner_class = SCANNERS[tool]
+    except KeyError:
+        raise ValueError(f"Unknown tool: {tool}") from None
 
     return scanner_class(mode=mode, target=target, wordlist=wordlist, options=options)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from krakenbuster.scanners.base import BaseScanner
+from krakenbuster.scanners.base import BaseScanner, dot_extensions
 
 
 class DirbScanner(BaseScanner):
@@ -21,9 +21,7 @@ class DirbScanner(BaseScanner):
 
         extensions = self._get_opt("extensions")
         if extensions:
-            cmd.extend(["-X", ",".join(
-                f".{e.strip('.')}" for e in extensions.split(",") if e.strip()
-            )])
+            cmd.extend(["-X", dot_extensions(extensions)])
 
         case_insensitive = self._get_opt_bool("case_insensitive", False)
         if case_insensitive:
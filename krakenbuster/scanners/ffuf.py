@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from krakenbuster.scanners.base import BaseScanner
+from krakenbuster.scanners.base import BaseScanner, dot_extensions
 
 
 class FfufScanner(BaseScanner):
@@ -31,9 +31,7 @@ class FfufScanner(BaseScanner):
 
         extensions = self._get_opt("extensions", "php,html,txt,js")
         if extensions:
-            cmd.extend(["-e", ",".join(
-                f".{e.strip('.')}" for e in extensions.split(",") if e.strip()
-            )])
+            cmd.extend(["-e", dot_extensions(extensions)])
 
         threads = self._get_opt("threads", "50")
         cmd.extend(["-t", threads])
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from krakenbuster.scanners.base import BaseScanner
+from krakenbuster.scanners.base import BaseScanner, dot_extensions
 
 
 class WfuzzScanner(BaseScanner):
@@ -50,9 +50,7 @@ class WfuzzScanner(BaseScanner):
 
         extensions = self._get_opt("extensions")
         if extensions:
-            ext_list = ",".join(
-                f".{e.strip('.')}" for e in extensions.split(",") if e.strip()
-            )
+            ext_list = dot_extensions(extensions)
             # wfuzz uses -z for payloads; for extensions we modify the URL
             target_with_ext = target.replace("FUZZ", "FUZZ{ext}")
             cmd = [
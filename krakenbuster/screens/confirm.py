@@ -29,7 +29,10 @@ class ConfirmScreen(Screen):
             )
             with Horizontal(id="confirm-panels"):
                 yield Static("", id="confirm-summary")
-                yield Static("", id="confirm-command")
+                yield Static(
+                    "[bold]Command Preview[/bold]\n\n[dim]Building command...[/dim]",
+                    id="confirm-command",
+                )
             with Horizontal(id="confirm-buttons"):
                 yield Button("Run Scan", id="run-btn", variant="success")
                 yield Button("Go Back", id="back-btn")
@@ -37,7 +40,8 @@ class ConfirmScreen(Screen):
     def on_mount(self) -> None:
         """Build the summary and command preview."""
         self._build_summary()
-        self._build_command_preview()
+        # Let the screen paint before building the command
+        self.call_after_refresh(self._build_command_preview)
 
     def _build_summary(self) -> None:
         """Build the options summary panel."""
@@ -68,8 +72,11 @@ class ConfirmScreen(Screen):
         summary = self.query_one("#confirm-summary", Static)
         summary.update("\n".join(lines))
 
-    def _build_command_preview(self) -> None:
-        """Build the command preview panel."""
+    def _build_command(self) -> tuple[list[str], str]:
+        """Build the scan command and its display string.
+
+        Both are reused if the configuration is unchanged.
+        """
         app = self.app
         tool = getattr(app, "selected_tool", "")
         scan_type = getattr(app, "scan_type", "")
@@ -77,12 +84,21 @@ class ConfirmScreen(Screen):
         wordlist = getattr(app, "wordlist_path", "")
         options = getattr(app, "scan_options", {})
 
+        cache = getattr(app, "command_cache", {})
+        key = (tool, scan_type, target, wordlist, tuple(sorted(options.items())))
+        entry = cache.get(key)
+        if entry is None:
+            scanner = create_scanner(tool, scan_type, target, wordlist, options)
+            command = tuple(scanner.build_command())
+            entry = cache[key] = (command, " ".join(command))
+        return list(entry[0]), entry[1]
+
+    def _build_command_preview(self) -> None:
+        """Build the command preview panel."""
         lines = ["[bold]Command Preview[/bold]", ""]
 
         try:
-            scanner = create_scanner(tool, scan_type, target, wordlist, options)
-            command = scanner.build_command()
-            cmd_str = " ".join(command)
+            _, cmd_str = self._build_command()
             lines.append(f"[bold white]$ {cmd_str}[/bold white]")
         except Exception as exc:
             lines.append(f"[red]Error building command: {exc}[/red]")
@@ -98,17 +114,10 @@ class ConfirmScreen(Screen):
 
     def _run_in_terminal(self) -> None:
         """Build the command and exit the TUI so it runs in the real terminal."""
-        app = self.app
-        tool = getattr(app, "selected_tool", "")
-        scan_type = getattr(app, "scan_type", "")
-        target = getattr(app, "target", "")
-        wordlist = getattr(app, "wordlist_path", "")
-        options = getattr(app, "scan_options", {})
-
         commands: list[list[str]] = []
         try:
-            scanner = create_scanner(tool, scan_type, target, wordlist, options)
-            commands.append(scanner.build_command())
+            command, _ = self._build_command()
+            commands.append(command)
         except Exception:
             pass
 
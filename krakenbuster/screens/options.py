@@ -122,6 +122,42 @@ TOOL_OPTIONS = {
     },
 }
 
+# Switch defaults treated as on
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+# An option entry with its switch default pre-parsed:
+# (key, label, default, widget_type, switch_value)
+_OptionEntry = tuple[str, str, str, str, bool]
+
+
+def _flatten_options() -> dict[tuple[str, str], tuple[_OptionEntry, ...]]:
+    """Flatten TOOL_OPTIONS to (tool, mode) -> entries.
+
+    Identical entries and identical mode lists are shared rather than
+    built once per tool.
+    """
+    canonical: dict[tuple, tuple] = {}
+    flat: dict[tuple[str, str], tuple[_OptionEntry, ...]] = {}
+    for tool, modes in TOOL_OPTIONS.items():
+        for mode, entries in modes.items():
+            parsed = []
+            for key, label, default, widget_type in entries:
+                entry = (key, label, default, widget_type, default.lower() in _TRUTHY)
+                parsed.append(canonical.setdefault(entry, entry))
+            mode_entries = tuple(parsed)
+            flat[(tool, mode)] = canonical.setdefault(mode_entries, mode_entries)
+    return flat
+
+
+_FLAT_OPTIONS = _flatten_options()
+
+# Options that must be filled in, per (tool, mode): (key, error message)
+_REQUIRED_FIELDS: dict[tuple[str, str], tuple[tuple[str, str], ...]] = {
+    (tool, "vhost"): (("domain", "Base domain is required for vhost mode"),)
+    for tool, modes in TOOL_OPTIONS.items()
+    if any(entry[0] == "domain" for entry in modes.get("vhost", ()))
+}
+
 
 class OptionsScreen(Screen):
     """Screen for configuring scan options."""
@@ -130,6 +166,9 @@ class OptionsScreen(Screen):
         Binding("escape", "go_back", "Back"),
     ]
 
+    _options: tuple[_OptionEntry, ...] = ()
+    _widgets: dict[str, Input | Switch] = {}  # option key -> its widget
+
     def compose(self) -> ComposeResult:
         yield Header()
         tool = getattr(self.app, "selected_tool", "feroxbuster")
@@ -141,23 +180,22 @@ class OptionsScreen(Screen):
                 id="options-title",
             )
 
-            options = self._get_options(tool, scan_type)
-            for key, label, default, widget_type in options:
+            self._options = self._get_options(tool, scan_type)
+            self._widgets = {}
+            for key, label, default, widget_type, switch_value in self._options:
                 with Horizontal(classes="option-row"):
                     yield Label(f"{label}:", classes="option-label")
                     if widget_type == "switch":
-                        sw = Switch(
-                            value=(default.lower() in ("true", "1", "yes", "on")),
-                            id=f"opt-{key}",
-                        )
-                        yield sw
+                        widget = Switch(value=switch_value, id=f"opt-{key}")
                     else:
                         placeholder = "required" if key == "domain" and not default else ""
-                        yield Input(
+                        widget = Input(
                             value=default,
                             placeholder=placeholder,
                             id=f"opt-{key}",
                         )
+                    self._widgets[key] = widget
+                    yield widget
 
             yield Label("", id="options-error")
             with Horizontal(id="options-buttons"):
@@ -168,10 +206,9 @@ class OptionsScreen(Screen):
                 id="options-hint",
             )
 
-    def _get_options(self, tool: str, mode: str) -> list[tuple[str, str, str, str]]:
+    def _get_options(self, tool: str, mode: str) -> tuple[_OptionEntry, ...]:
         """Get the option definitions for a tool and mode."""
-        tool_opts = TOOL_OPTIONS.get(tool, {})
-        return tool_opts.get(mode, [])
+        return _FLAT_OPTIONS.get((tool, mode), ())
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "options-continue-btn":
@@ -184,26 +221,23 @@ class OptionsScreen(Screen):
         tool = getattr(self.app, "selected_tool", "feroxbuster")
         scan_type = getattr(self.app, "scan_type", "directory")
 
-        options = self._get_options(tool, scan_type)
         collected: dict[str, str] = {}
 
-        for key, label, default, widget_type in options:
-            widget_id = f"opt-{key}"
-            try:
-                if widget_type == "switch":
-                    widget = self.query_one(f"#{widget_id}", Switch)
-                    collected[key] = str(widget.value).lower()
-                else:
-                    widget = self.query_one(f"#{widget_id}", Input)
-                    collected[key] = widget.value
-            except Exception:
+        for key, _, default, _, _ in self._options:
+            widget = self._widgets.get(key)
+            if widget is None:
                 collected[key] = default
+            elif isinstance(widget, Switch):
+                collected[key] = str(widget.value).lower()
+            else:
+                collected[key] = widget.value
 
         # Validate required fields
-        if "domain" in collected and not collected["domain"] and scan_type == "vhost":
-            error_label = self.query_one("#options-error", Label)
-            error_label.update("[bold red]Base domain is required for vhost mode[/bold red]")
-            return
+        for key, message in _REQUIRED_FIELDS.get((tool, scan_type), ()):
+            if not collected.get(key):
+                error_label = self.query_one("#options-error", Label)
+                error_label.update(f"[bold red]{message}[/bold red]")
+                return
 
         self.app.scan_options = collected
         self.app.go_to_confirm()
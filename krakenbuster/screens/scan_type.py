@@ -8,6 +8,8 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Header, Label, RadioButton, RadioSet, Static
 
+from rich.text import Text
+
 
 SCAN_TYPES = {
     "directory": {
@@ -24,6 +26,12 @@ SCAN_TYPES = {
     },
 }
 
+_SCAN_KEYS = tuple(SCAN_TYPES)
+# Descriptions pre-styled so updating the label skips markup parsing
+_SCAN_DESCRIPTIONS = tuple(
+    Text(info["description"], style="italic") for info in SCAN_TYPES.values()
+)
+
 
 class ScanTypeScreen(Screen):
     """Screen for selecting the scan type."""
@@ -33,6 +41,8 @@ class ScanTypeScreen(Screen):
     ]
 
     _current_index: int = 0
+    _radio_set: RadioSet
+    _desc_label: Label
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -54,8 +64,9 @@ class ScanTypeScreen(Screen):
 
     def on_mount(self) -> None:
         """Select the first radio button by default and show its description."""
-        radio_set = self.query_one("#scan-type-radio", RadioSet)
-        radio_set.focus()
+        self._radio_set = self.query_one("#scan-type-radio", RadioSet)
+        self._desc_label = self.query_one("#scan-type-description", Label)
+        self._radio_set.focus()
         self._current_index = 0
         self._update_description(0)
 
@@ -74,19 +85,14 @@ class ScanTypeScreen(Screen):
             self._confirm_selection()
 
     def _update_description(self, index: int) -> None:
-        keys = list(SCAN_TYPES.keys())
-        if 0 <= index < len(keys):
-            desc = SCAN_TYPES[keys[index]]["description"]
-            label = self.query_one("#scan-type-description", Label)
-            label.update(f"[italic]{desc}[/italic]")
+        if 0 <= index < len(_SCAN_DESCRIPTIONS):
+            self._desc_label.update(_SCAN_DESCRIPTIONS[index])
 
     def action_quit_app(self) -> None:
         self.app.exit()
 
     def _confirm_selection(self) -> None:
-        radio_set = self.query_one("#scan-type-radio", RadioSet)
-        index = radio_set.pressed_index
-        keys = list(SCAN_TYPES.keys())
-        if 0 <= index < len(keys):
-            self.app.scan_type = keys[index]
+        index = self._radio_set.pressed_index
+        if 0 <= index < len(_SCAN_KEYS):
+            self.app.scan_type = _SCAN_KEYS[index]
             self.app.go_to_tool_select()
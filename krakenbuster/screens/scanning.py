@@ -8,6 +8,7 @@ import time
 from collections import deque
 from pathlib import Path
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -23,9 +24,10 @@ from textual.widgets import (
 )
 
 from krakenbuster.output import (
+    STDERR_TAIL_LINES,
     Finding,
+    RawOutputWriter,
     ScanResult,
-    append_raw_line,
     generate_output_paths,
     parse_finding,
     parse_progress,
@@ -39,6 +41,69 @@ from krakenbuster.wordlist import count_lines
 _VERBOSE_TOOLS = {"feroxbuster"}
 # Tools that only output findings (need progress parsing or estimation)
 _SPARSE_TOOLS = {"dirb", "gobuster", "ffuf", "wfuzz", "dirsearch"}
+# Queued output is written to the widgets at most this often (about 30 fps)
+_UI_FLUSH_SECONDS = 1 / 30
+# The testing label changes on nearly every line, so it is redrawn less often
+_TESTING_LABEL_SECONDS = 0.1
+# A log line identical to the one just before it is not shown again if it
+# arrives within this many seconds (unchanged progress redraws)
+_REPEAT_WINDOW_SECONDS = 0.05
+# Longest a finished scan waits for the wordlist count before the summary,
+# which then reports whatever total the tool gave
+_COUNT_WAIT_SECONDS = 2.0
+# Most output lines taken from a scanner per batch
+_BATCH_LINES = 512
+# Output batches with at least this many lines are parsed in a worker thread;
+# smaller ones are parsed inline, where the thread hand-off costs more
+_EXECUTOR_MIN_LINES = 256
+
+
+_STATUS_COLOURS: dict[int, str] = {200: "green"}
+_STATUS_COLOURS.update(dict.fromkeys((301, 302, 307), "yellow"))
+_STATUS_COLOURS.update(dict.fromkeys((401, 403), "cyan"))
+
+
+def _status_colour(code: int | None) -> str:
+    """Return colour for a status code."""
+    if code is None:
+        return "white"
+    return _STATUS_COLOURS.get(code, "red" if code >= 500 else "white")
+
+
+# Status tag and its style written before a raw log line, for every code
+# the parsers accept, built once
+_STATUS_PREFIXES = {
+    code: (f"[{code}]", _status_colour(code)) for code in range(100, 600)
+}
+
+
+def _parse_lines(lines: list[ScanLine]) -> list[tuple[Text, Finding | None]]:
+    """Build the log text and parse the finding for each stdout line.
+
+    The tool's text is never parsed as markup, so brackets in its output
+    can't style other lines. Stderr lines are not parsed and get their raw
+    text and no finding.
+    """
+    parsed = []
+    for line in lines:
+        raw = line.raw
+        if line.is_stderr:
+            parsed.append((Text(raw), None))
+            continue
+        # parse_finding only returns None when the line has no status code,
+        # so the finding's status is the only one the tag needs
+        finding = parse_finding(raw)
+        if finding is not None:
+            prefix = _STATUS_PREFIXES[finding.status_code]
+            parsed.append((Text.assemble(prefix, " ", raw), finding))
+        else:
+            parsed.append((Text(raw), None))
+    return parsed
+
+
+def _progress_stats_markup(progress_text: str, stats_text: str) -> str:
+    """Lay out the progress and stats lines shown under the progress bar."""
+    return f"{progress_text}\n[#a0a8b8]{stats_text}[/]"
 
 
 class ScanOutputLine(Message):
@@ -50,6 +115,25 @@ class ScanOutputLine(Message):
         self.scanner_id = scanner_id
 
 
+class ScanOutputBatch(Message):
+    """Message posted with a batch of scan output lines.
+
+    parsed holds the log text and finding for each line, as built by
+    _parse_lines().
+    """
+
+    def __init__(
+        self,
+        lines: list[ScanLine],
+        parsed: list[tuple[Text, Finding | None]],
+        scanner_id: str = "primary",
+    ) -> None:
+        super().__init__()
+        self.lines = lines
+        self.parsed = parsed
+        self.scanner_id = scanner_id
+
+
 class ScanComplete(Message):
     """Message posted when a scan finishes."""
 
@@ -74,38 +158,57 @@ class ScanningScreen(Screen):
     _configured_rate: int = 200  # configured rate limit for estimation
     _errors: int = 0
     _findings: list[Finding] = []
-    _raw_lines: list[str] = []
-    _stderr_lines: list[str] = []
-    _rate_samples: deque = deque(maxlen=50)
+    _stderr_lines: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
     _scanner = None
     _vhost_scanner = None
     _scan_tasks: list[asyncio.Task] = []
+    _count_task: asyncio.Task | None = None  # wordlist line count
     _raw_path: Path | None = None
     _json_path: Path | None = None
     _vhost_raw_path: Path | None = None
     _vhost_json_path: Path | None = None
+    _raw_writers: dict[str, RawOutputWriter] = {}  # scanner id -> raw file writer
     _vhost_findings: list[Finding] = []
     _vhost_lines_received: int = 0
-    _vhost_raw_lines: list[str] = []
-    _vhost_stderr_lines: list[str] = []
+    _vhost_stderr_lines: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
     _completed_scanners: int = 0
     _total_scanners: int = 1
     _tool_name: str = ""
+    _verbose_tool: bool = False  # tool prints a line per request
+    _top_bar_prefix: str = ""  # tool, target and wordlist part of the top bar
+    _top_bar_text: str = ""  # text currently in the top bar
+    _progress_stats_text: str = ""  # markup currently in the progress block
+    # Widgets looked up once in on_mount; the vhost ones only exist in combined mode
+    _top_bar: Static
+    _progress_bar: ProgressBar
+    _progress_stats: Static
+    _testing_label: Label
+    _findings_table: DataTable
+    _findings_count: Label
+    _vhost_findings_table: DataTable | None = None
+    _vhost_findings_count: Label | None = None
+    _logs: dict[str, RichLog] = {}  # log widget id -> widget
+    _log_pending: dict[str, list[Text]] = {}  # log widget id -> lines to write
+    _log_last: dict[str, tuple[str, float]] = {}  # log widget id -> (last line, when)
+    _findings_pending: dict[str, list[Finding]] = {}  # scanner id -> new rows
+    _testing_pending: str | None = None  # latest line for the testing label
+    _testing_shown: str = ""  # text currently in the testing label
+    _testing_updated: float = 0.0  # monotonic time of the last label update
 
     def compose(self) -> ComposeResult:
         scan_type = getattr(self.app, "scan_type", "directory")
         tool = getattr(self.app, "selected_tool", "")
         target = getattr(self.app, "target", "")
-        wordlist = getattr(self.app, "wordlist_path", "")
+        wordlist_name = Path(getattr(self.app, "wordlist_path", "")).name
+        # These do not change during a scan, so build their part of the top bar once
+        self._top_bar_prefix = f"[bold]{tool}[/bold] | {target} | {wordlist_name} | "
+        self._top_bar_text = f"{self._top_bar_prefix}Elapsed: 0s | 0 req/s"
 
         yield Header()
 
         with Vertical(id="scanning-outer"):
             # Top bar
-            yield Static(
-                f"[bold]{tool}[/bold] | {target} | {Path(wordlist).name} | Elapsed: 0s | 0 req/s",
-                id="scan-top-bar",
-            )
+            yield Static(self._top_bar_text, id="scan-top-bar")
 
             # Main content area
             with Horizontal(id="scanning-main"):
@@ -118,12 +221,12 @@ class ScanningScreen(Screen):
                             show_eta=False,
                             id="scan-progress",
                         )
-                        yield Label("Progress: 0%  (0 / ?)", id="progress-label")
-                        yield Label("Testing: ...", id="testing-label")
-                        yield Label(
+                        self._progress_stats_text = _progress_stats_markup(
+                            "Progress: 0%  (0 / ?)",
                             "Sent: 0   Rate: 0 req/s   ETA: --   Depth: --   Errors: 0",
-                            id="stats-label",
                         )
+                        yield Static(self._progress_stats_text, id="progress-stats")
+                        yield Label("Testing: ...", id="testing-label")
 
                     # Findings table
                     with Vertical(id="findings-panel"):
@@ -146,34 +249,40 @@ class ScanningScreen(Screen):
                 with Vertical(id="scanning-right"):
                     yield RichLog(
                         highlight=True,
-                        markup=True,
                         id="raw-output",
                     )
                     if scan_type == "combined":
                         yield RichLog(
                             highlight=True,
-                            markup=True,
                             id="vhost-raw-output",
                         )
 
     def on_mount(self) -> None:
         """Initialise state and start the scan."""
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._lines_received = 0
         self._requests_estimated = 0
         self._progress_from_tool = False
         self._errors = 0
         self._findings = []
-        self._raw_lines = []
-        self._stderr_lines = []
-        self._rate_samples = deque(maxlen=50)
+        self._stderr_lines = deque(maxlen=STDERR_TAIL_LINES)
         self._scan_tasks = []
+        self._scanner = None
+        self._vhost_scanner = None
+        self._count_task = None
+        self._raw_writers = {}
         self._completed_scanners = 0
         self._vhost_findings = []
         self._vhost_lines_received = 0
-        self._vhost_raw_lines = []
-        self._vhost_stderr_lines = []
+        self._vhost_stderr_lines = deque(maxlen=STDERR_TAIL_LINES)
         self._tool_name = getattr(self.app, "selected_tool", "")
+        self._verbose_tool = self._tool_name in _VERBOSE_TOOLS
+        self._log_pending = {"raw-output": [], "vhost-raw-output": []}
+        self._log_last = {}
+        self._findings_pending = {"primary": [], "vhost": []}
+        self._testing_pending = None
+        self._testing_shown = ""
+        self._testing_updated = 0.0
 
         # Read configured rate limit for estimation fallback
         options = getattr(self.app, "scan_options", {})
@@ -182,23 +291,33 @@ class ScanningScreen(Screen):
         except (ValueError, TypeError):
             self._configured_rate = 200
 
+        self._top_bar = self.query_one("#scan-top-bar", Static)
+        self._progress_bar = self.query_one("#scan-progress", ProgressBar)
+        self._progress_stats = self.query_one("#progress-stats", Static)
+        self._testing_label = self.query_one("#testing-label", Label)
+        self._findings_count = self.query_one("#findings-count", Label)
+        self._logs = {log.id: log for log in self.query(RichLog)}
+
         # Set up findings table
-        table = self.query_one("#findings-table", DataTable)
-        table.add_columns("Status", "Size", "Words", "Lines", "URL")
-        table.fixed_columns = 5
+        self._findings_table = self.query_one("#findings-table", DataTable)
+        self._findings_table.add_columns("Status", "Size", "Words", "Lines", "URL")
+        self._findings_table.fixed_columns = 5
 
         scan_type = getattr(self.app, "scan_type", "directory")
         if scan_type == "combined":
             self._total_scanners = 2
-            try:
-                vhost_table = self.query_one("#vhost-findings-table", DataTable)
-                vhost_table.add_columns("Status", "Size", "Words", "Lines", "Vhost")
-                vhost_table.fixed_columns = 5
-            except Exception:
-                pass
-
-        # Start the periodic stats refresh
+            vhost_table = self.query_one("#vhost-findings-table", DataTable)
+            vhost_table.add_columns("Status", "Size", "Words", "Lines", "Vhost")
+            vhost_table.fixed_columns = 5
+            self._vhost_findings_table = vhost_table
+            self._vhost_findings_count = self.query_one("#vhost-findings-count", Label)
+        else:
+            self._vhost_findings_table = None
+            self._vhost_findings_count = None
+
+        # Start the periodic stats refresh and widget flushing
         self.set_interval(1.0, self._refresh_stats)
+        self.set_interval(_UI_FLUSH_SECONDS, self._flush_ui)
 
         # Start the scan
         self.run_worker(self._start_scan())
@@ -214,15 +333,10 @@ class ScanningScreen(Screen):
 
         effective_mode = scan_type if scan_type != "combined" else "directory"
 
-        # Count total words
+        # Count total words alongside the scan rather than before it
         wl_path = Path(wordlist)
         if wl_path.exists():
-            self._total_words = await count_lines(wl_path)
-            try:
-                progress = self.query_one("#scan-progress", ProgressBar)
-                progress.update(total=max(self._total_words, 1))
-            except Exception:
-                pass
+            self._count_task = asyncio.create_task(self._count_words(wl_path))
 
         # Generate output paths
         from krakenbuster.config import load_config
@@ -232,14 +346,11 @@ class ScanningScreen(Screen):
             target, tool, effective_mode, output_dir
         )
 
-        # Create and run primary scanner
+        # Create the scanners before opening any files, so an unknown tool
+        # fails without leaving writers behind
         self._scanner = create_scanner(tool, effective_mode, target, wordlist, options)
-        primary_task = asyncio.create_task(
-            self._run_scanner(self._scanner, "primary")
-        )
-        self._scan_tasks.append(primary_task)
 
-        # Combined mode: also run vhost scanner
+        # Combined mode: also create vhost scanner
         if scan_type == "combined":
             vhost_tool = getattr(app, "selected_vhost_tool", "ffuf")
             vhost_options = getattr(app, "vhost_options", {})
@@ -249,19 +360,54 @@ class ScanningScreen(Screen):
             self._vhost_scanner = create_scanner(
                 vhost_tool, "vhost", target, wordlist, vhost_options
             )
-            vhost_task = asyncio.create_task(
-                self._run_scanner(self._vhost_scanner, "vhost")
+
+        try:
+            self._start_raw_writer("primary", self._raw_path)
+            if self._vhost_scanner is not None:
+                self._start_raw_writer("vhost", self._vhost_raw_path)
+        except OSError:
+            for writer in self._raw_writers.values():
+                await asyncio.to_thread(writer.close)
+            self._raw_writers = {}
+            raise
+
+        # Run the scanners and wait for all of them; if this worker is
+        # cancelled, the group cancels the scanners with it
+        async with asyncio.TaskGroup() as group:
+            self._scan_tasks.append(
+                group.create_task(self._run_scanner(self._scanner, "primary"))
             )
-            self._scan_tasks.append(vhost_task)
+            if self._vhost_scanner is not None:
+                self._scan_tasks.append(
+                    group.create_task(self._run_scanner(self._vhost_scanner, "vhost"))
+                )
 
-        # Wait for all scanners to complete
-        await asyncio.gather(*self._scan_tasks, return_exceptions=True)
+    async def _count_words(self, wl_path: Path) -> None:
+        """Count the wordlist and use it as the progress total."""
+        count = await count_lines(wl_path)
+        # The tool may already have reported a larger total while we counted
+        self._total_words = max(self._total_words, count)
+        self._progress_bar.update(total=max(self._total_words, 1))
+
+    def _start_raw_writer(self, scanner_id: str, path: Path) -> None:
+        """Open the raw output file for a scanner on a writer thread."""
+        writer = RawOutputWriter(path)
+        writer.start()
+        self._raw_writers[scanner_id] = writer
 
     async def _run_scanner(self, scanner, scanner_id: str) -> None:
-        """Run a single scanner and post messages for each line."""
+        """Run a single scanner and post its output, parsed, in batches."""
+        loop = asyncio.get_running_loop()
         try:
-            async for scan_line in scanner.run_scan():
-                self.post_message(ScanOutputLine(scan_line, scanner_id))
+            async for lines in scanner.run_scan_batched(batch=_BATCH_LINES):
+                if len(lines) >= _EXECUTOR_MIN_LINES:
+                    parsed = await loop.run_in_executor(None, _parse_lines, lines)
+                else:
+                    parsed = _parse_lines(lines)
+                self.post_message(ScanOutputBatch(lines, parsed, scanner_id))
+                # Written from here rather than the message handler, so a
+                # slow disk holds back this reader and never the UI
+                await self._write_raw(scanner_id, lines)
         except Exception as exc:
             self.post_message(
                 ScanOutputLine(
@@ -299,78 +445,137 @@ class ScanningScreen(Screen):
 
     def on_scan_output_line(self, message: ScanOutputLine) -> None:
         """Handle a line of scanner output."""
-        line = message.line
-        scanner_id = message.scanner_id
+        log_text, finding = _parse_lines([message.line])[0]
+        self._line_handler(message.scanner_id)(
+            message.line, log_text, finding, time.monotonic()
+        )
+        if not message.line.is_stderr and message.scanner_id != "vhost":
+            self._testing_pending = message.line.raw
+
+    def on_scan_output_batch(self, message: ScanOutputBatch) -> None:
+        """Handle a batch of scanner output lines."""
+        last_stdout: str | None = None
+        handle_line = self._line_handler(message.scanner_id)
+        now = time.monotonic()
+        for line, (log_text, finding) in zip(message.lines, message.parsed):
+            handle_line(line, log_text, finding, now)
+            if not line.is_stderr:
+                last_stdout = line.raw
+        # Only the latest line is shown in the testing label
+        if last_stdout is not None and message.scanner_id != "vhost":
+            self._testing_pending = last_stdout
+
+    async def _write_raw(self, scanner_id: str, lines: list[ScanLine]) -> None:
+        """Queue a batch's stdout lines for the scanner's raw output file."""
+        writer = self._raw_writers.get(scanner_id)
+        stdout = [line.raw for line in lines if not line.is_stderr]
+        if writer is not None and stdout:
+            await writer.write(("\n".join(stdout) + "\n").encode())
+
+    def _line_handler(self, scanner_id: str):
+        """Return the line handler for a scanner, picked once per message."""
+        if scanner_id == "vhost":
+            return self._handle_vhost_line
+        return self._handle_primary_line
+
+    def _queue_log(self, log_id: str, raw: str, log_text: Text, now: float) -> None:
+        """Queue a line for a log unless it just repeats the previous one.
+
+        Only the log view skips repeats; the raw file, findings and progress
+        counts see every line.
+        """
+        last_raw, last_time = self._log_last.get(log_id, ("", 0.0))
+        if raw == last_raw and now - last_time < _REPEAT_WINDOW_SECONDS:
+            return
+        self._log_last[log_id] = (raw, now)
+        self._log_pending[log_id].append(log_text)
 
+    def _handle_primary_line(
+        self, line: ScanLine, log_text: Text, finding: Finding | None, now: float
+    ) -> None:
+        """Record and log a single parsed line from the primary scanner."""
         if line.is_stderr:
-            if scanner_id == "vhost":
-                self._vhost_stderr_lines.append(line.raw)
-            else:
-                self._stderr_lines.append(line.raw)
+            self._stderr_lines.append(line.raw)
             # Also check stderr for progress indicators
-            if scanner_id != "vhost":
-                self._try_parse_progress(line.raw)
+            self._try_parse_progress(line.raw)
             return
 
-        # Track raw lines
-        if scanner_id == "vhost":
-            self._vhost_lines_received += 1
-            self._vhost_raw_lines.append(line.raw)
-        else:
-            self._lines_received += 1
-            self._raw_lines.append(line.raw)
-            self._rate_samples.append(time.time())
-            # Check stdout for progress indicators too
-            self._try_parse_progress(line.raw)
+        self._lines_received += 1
+        # Check stdout for progress indicators too
+        self._try_parse_progress(line.raw)
 
         # For verbose tools, line count is a good progress proxy
-        if self._tool_name in _VERBOSE_TOOLS and scanner_id != "vhost":
+        if self._verbose_tool:
             self._requests_estimated = max(
                 self._requests_estimated, self._lines_received
             )
 
-        # Write to raw output file
-        raw_path = self._vhost_raw_path if scanner_id == "vhost" else self._raw_path
-        if raw_path:
-            self.run_worker(append_raw_line(raw_path, line.raw))
-
-        # Parse and display
-        status = self._detect_status(line.raw)
-        colour = self._status_colour(status)
+        self._queue_log("raw-output", line.raw, log_text, now)
+        if finding:
+            self._findings.append(finding)
+            self._findings_pending["primary"].append(finding)
 
-        # Update raw output log
-        try:
-            log_id = "vhost-raw-output" if scanner_id == "vhost" else "raw-output"
-            raw_log = self.query_one(f"#{log_id}", RichLog)
-            if status:
-                raw_log.write(f"[{colour}][{status}][/{colour}] {line.raw}")
-            else:
-                raw_log.write(line.raw)
-        except Exception:
-            pass
+    def _handle_vhost_line(
+        self, line: ScanLine, log_text: Text, finding: Finding | None, now: float
+    ) -> None:
+        """Record and log a single parsed line from the vhost scanner."""
+        if line.is_stderr:
+            self._vhost_stderr_lines.append(line.raw)
+            return
 
-        # Parse finding
-        finding = parse_finding(line.raw)
+        self._vhost_lines_received += 1
+        self._queue_log("vhost-raw-output", line.raw, log_text, now)
         if finding:
-            if scanner_id == "vhost":
-                self._vhost_findings.append(finding)
-                self._update_vhost_findings_table(finding)
-            else:
-                self._findings.append(finding)
-                self._update_findings_table(finding)
-
-        # Update testing label with current word
-        if scanner_id != "vhost":
-            try:
-                testing = self.query_one("#testing-label", Label)
-                # Truncate long lines
-                display = line.raw[:80] + "..." if len(line.raw) > 80 else line.raw
-                testing.update(f"Testing: {display}")
-            except Exception:
-                pass
+            self._vhost_findings.append(finding)
+            self._findings_pending["vhost"].append(finding)
+
+    def _update_testing_label(self, raw: str) -> None:
+        """Show the current word being tested."""
+        # Truncate long lines
+        display = raw[:80] + "..." if len(raw) > 80 else raw
+        if display != self._testing_shown:
+            self._testing_label.update(f"Testing: {display}")
+            self._testing_shown = display
+
+    def _flush_ui(self) -> None:
+        """Write queued output to the widgets, one update per widget."""
+        self._flush_logs()
+
+        primary = self._findings_pending["primary"]
+        if primary:
+            self._update_findings_table(primary)
+            primary.clear()
+        vhost = self._findings_pending["vhost"]
+        if vhost:
+            self._update_vhost_findings_table(vhost)
+            vhost.clear()
+
+        if self._testing_pending is not None:
+            now = time.monotonic()
+            if now - self._testing_updated >= _TESTING_LABEL_SECONDS:
+                self._update_testing_label(self._testing_pending)
+                self._testing_pending = None
+                self._testing_updated = now
+
+    def _flush_logs(self) -> None:
+        """Write queued raw output to the logs in one call per log."""
+        for log_id, pending in self._log_pending.items():
+            if not pending:
+                continue
+            raw_log = self._logs.get(log_id)
+            if raw_log is None:
+                pending.clear()
+                continue
+            text = Text("\n").join(pending)
+            # RichLog only highlights str content, so apply it here
+            if raw_log.highlight:
+                text = raw_log.highlighter(text)
+            raw_log.write(text)
+            pending.clear()
 
     def on_scan_complete(self, message: ScanComplete) -> None:
         """Handle scan completion."""
+        self._flush_ui()
         self._completed_scanners += 1
 
         if self._completed_scanners >= self._total_scanners:
@@ -379,12 +584,22 @@ class ScanningScreen(Screen):
 
     async def _finalise(self) -> None:
         """Write final output files and navigate to summary."""
+        if self._count_task is not None:
+            await asyncio.wait({self._count_task}, timeout=_COUNT_WAIT_SECONDS)
+            # No-op if the count finished; the gather collects either outcome
+            self._count_task.cancel()
+            await asyncio.gather(self._count_task, return_exceptions=True)
+        for writer in self._raw_writers.values():
+            await asyncio.to_thread(writer.close)
+        self._raw_writers = {}
+        writes = []
         if self._json_path:
-            await write_json_results(self._json_path, self._findings)
+            writes.append(write_json_results(self._json_path, self._findings))
         if self._vhost_json_path:
-            await write_json_results(self._vhost_json_path, self._vhost_findings)
+            writes.append(write_json_results(self._vhost_json_path, self._vhost_findings))
+        await asyncio.gather(*writes)
 
-        duration = time.time() - self._start_time
+        duration = time.monotonic() - self._start_time
 
         result = ScanResult(
             tool=getattr(self.app, "selected_tool", ""),
@@ -393,51 +608,50 @@ class ScanningScreen(Screen):
             wordlist=getattr(self.app, "wordlist_path", ""),
             total_words=self._total_words,
             duration_seconds=duration,
-            findings=self._findings + self._vhost_findings,
-            raw_lines=self._raw_lines,
-            stderr_lines=self._stderr_lines + self._vhost_stderr_lines,
+            # Only combined scans need a merged copy of the findings
+            findings=(
+                self._findings + self._vhost_findings
+                if self._vhost_findings
+                else self._findings
+            ),
+            stderr_lines=deque(
+                [*self._stderr_lines, *self._vhost_stderr_lines],
+                maxlen=STDERR_TAIL_LINES,
+            ),
             errors=self._errors,
+            raw_path=self._raw_path,
+            json_path=self._json_path,
+            vhost_raw_path=self._vhost_raw_path,
+            vhost_json_path=self._vhost_json_path,
         )
 
-        # Store output paths for summary
-        result._raw_path = self._raw_path
-        result._json_path = self._json_path
-        result._vhost_raw_path = self._vhost_raw_path
-        result._vhost_json_path = self._vhost_json_path
-
         self.app.call_later(self.app.go_to_summary, result)
 
-    def _update_findings_table(self, finding: Finding) -> None:
-        """Add a finding to the primary findings table."""
-        try:
-            table = self.query_one("#findings-table", DataTable)
-            table.add_row(
+    @staticmethod
+    def _finding_rows(findings: list[Finding]) -> list[tuple[str, ...]]:
+        """Format findings as findings table rows."""
+        return [
+            (
                 str(finding.status_code),
                 str(finding.size),
                 str(finding.words),
                 str(finding.lines),
                 finding.url or "N/A",
             )
-            count_label = self.query_one("#findings-count", Label)
-            count_label.update(f"{len(self._findings)} findings so far")
-        except Exception:
-            pass
+            for finding in findings
+        ]
 
-    def _update_vhost_findings_table(self, finding: Finding) -> None:
-        """Add a finding to the vhost findings table."""
-        try:
-            table = self.query_one("#vhost-findings-table", DataTable)
-            table.add_row(
-                str(finding.status_code),
-                str(finding.size),
-                str(finding.words),
-                str(finding.lines),
-                finding.url or "N/A",
-            )
-            count_label = self.query_one("#vhost-findings-count", Label)
-            count_label.update(f"{len(self._vhost_findings)} vhost findings")
-        except Exception:
-            pass
+    def _update_findings_table(self, findings: list[Finding]) -> None:
+        """Add new findings to the primary findings table."""
+        self._findings_table.add_rows(self._finding_rows(findings))
+        self._findings_count.update(f"{len(self._findings)} findings so far")
+
+    def _update_vhost_findings_table(self, findings: list[Finding]) -> None:
+        """Add new findings to the vhost findings table."""
+        if self._vhost_findings_table is None or self._vhost_findings_count is None:
+            return
+        self._vhost_findings_table.add_rows(self._finding_rows(findings))
+        self._vhost_findings_count.update(f"{len(self._vhost_findings)} vhost findings")
 
     def _get_estimated_requests(self, elapsed: float) -> int | None:
         """Get the best estimate of requests completed so far.
@@ -450,7 +664,7 @@ class ScanningScreen(Screen):
             return self._requests_estimated
 
         # For verbose tools, line count is accurate
-        if self._tool_name in _VERBOSE_TOOLS:
+        if self._verbose_tool:
             return self._lines_received
 
         # No reliable progress available for this tool
@@ -458,7 +672,7 @@ class ScanningScreen(Screen):
 
     def _refresh_stats(self) -> None:
         """Update the top bar and progress stats every second."""
-        elapsed = time.time() - self._start_time
+        elapsed = time.monotonic() - self._start_time
         elapsed_str = self._format_elapsed(elapsed)
 
         # Estimate requests completed (may be None if unknown)
@@ -472,19 +686,11 @@ class ScanningScreen(Screen):
         else:
             rate_str = "-- req/s"
 
-        # Update top bar
-        tool = getattr(self.app, "selected_tool", "")
-        target = getattr(self.app, "target", "")
-        wordlist = Path(getattr(self.app, "wordlist_path", "")).name
-
-        try:
-            top_bar = self.query_one("#scan-top-bar", Static)
-            top_bar.update(
-                f"[bold]{tool}[/bold] | {target} | {wordlist} | "
-                f"Elapsed: {elapsed_str} | {rate_str}"
-            )
-        except Exception:
-            pass
+        # Update top bar, unless the rounded elapsed time and rate are unchanged
+        top_bar_text = f"{self._top_bar_prefix}Elapsed: {elapsed_str} | {rate_str}"
+        if top_bar_text != self._top_bar_text:
+            self._top_bar.update(top_bar_text)
+            self._top_bar_text = top_bar_text
 
         # Update progress
         if progress_known and self._total_words > 0:
@@ -506,32 +712,21 @@ class ScanningScreen(Screen):
                 f"Findings: {len(self._findings)}   Errors: {self._errors}"
             )
 
-        try:
-            progress_bar = self.query_one("#scan-progress", ProgressBar)
-            if progress_known:
-                progress_bar.update(
-                    total=max(self._total_words, 1), progress=est_requests
-                )
-            else:
-                # Pulse animation: cycle progress to indicate activity
-                cycle = int(elapsed * 10) % max(self._total_words, 100)
-                progress_bar.update(
-                    total=max(self._total_words, 100), progress=cycle
-                )
-        except Exception:
-            pass
-
-        try:
-            progress_label = self.query_one("#progress-label", Label)
-            progress_label.update(progress_text)
-        except Exception:
-            pass
+        if progress_known:
+            self._progress_bar.update(
+                total=max(self._total_words, 1), progress=est_requests
+            )
+        else:
+            # Pulse animation: cycle progress to indicate activity
+            cycle = int(elapsed * 10) % max(self._total_words, 100)
+            self._progress_bar.update(
+                total=max(self._total_words, 100), progress=cycle
+            )
 
-        try:
-            stats_label = self.query_one("#stats-label", Label)
-            stats_label.update(stats_text)
-        except Exception:
-            pass
+        progress_stats_text = _progress_stats_markup(progress_text, stats_text)
+        if progress_stats_text != self._progress_stats_text:
+            self._progress_stats.update(progress_stats_text)
+            self._progress_stats_text = progress_stats_text
 
     def _format_elapsed(self, seconds: float) -> str:
         """Format elapsed time."""
@@ -550,25 +745,6 @@ class ScanningScreen(Screen):
         eta_seconds = remaining / rate
         return self._format_elapsed(eta_seconds)
 
-    def _detect_status(self, line: str) -> int | None:
-        """Detect HTTP status code from line."""
-        from krakenbuster.output import parse_status_code
-        return parse_status_code(line)
-
-    def _status_colour(self, code: int | None) -> str:
-        """Return colour for a status code."""
-        if code is None:
-            return "white"
-        if code == 200:
-            return "green"
-        elif code in (301, 302, 307):
-            return "yellow"
-        elif code in (401, 403):
-            return "cyan"
-        elif code >= 500:
-            return "red"
-        return "white"
-
     def action_cancel_scan(self) -> None:
         """Cancel the running scan."""
         if self._scanner:
@@ -579,5 +755,8 @@ class ScanningScreen(Screen):
         for task in self._scan_tasks:
             if not task.done():
                 task.cancel()
+        # Don't hold up the summary for a progress total nobody will see
+        if self._count_task is not None and not self._count_task.done():
+            self._count_task.cancel()
 
         self.notify("Scan cancelled", severity="warning")
@@ -70,19 +70,14 @@ class SummaryScreen(Screen):
 
         # Output files
         file_lines = ["", "[bold]Output files:[/bold]"]
-        raw_path = getattr(result, "_raw_path", None)
-        json_path = getattr(result, "_json_path", None)
-        vhost_raw_path = getattr(result, "_vhost_raw_path", None)
-        vhost_json_path = getattr(result, "_vhost_json_path", None)
-
-        if raw_path:
-            file_lines.append(f"  Raw:  {raw_path}")
-        if json_path:
-            file_lines.append(f"  JSON: {json_path}")
-        if vhost_raw_path:
-            file_lines.append(f"  Vhost raw:  {vhost_raw_path}")
-        if vhost_json_path:
-            file_lines.append(f"  Vhost JSON: {vhost_json_path}")
+        if result.raw_path:
+            file_lines.append(f"  Raw:  {result.raw_path}")
+        if result.json_path:
+            file_lines.append(f"  JSON: {result.json_path}")
+        if result.vhost_raw_path:
+            file_lines.append(f"  Vhost raw:  {result.vhost_raw_path}")
+        if result.vhost_json_path:
+            file_lines.append(f"  Vhost JSON: {result.vhost_json_path}")
 
         files_widget = self.query_one("#summary-files", Static)
         files_widget.update("\n".join(file_lines))
@@ -93,13 +88,20 @@ class SummaryScreen(Screen):
                 "",
                 "[bold red]Warnings and errors:[/bold red]",
             ]
-            for line in result.stderr_lines[-20:]:
+            for line in list(result.stderr_lines)[-20:]:
                 stderr_lines.append(f"  [red]{line}[/red]")
             stderr_widget = self.query_one("#summary-stderr", Static)
             stderr_widget.update("\n".join(stderr_lines))
 
     def _build_findings_table(self, result: ScanResult) -> str:
-        """Build a Rich table markup for findings breakdown."""
+        """Build a Rich table markup for findings breakdown.
+
+        The rendered table is kept on the result, so showing the same
+        result again skips the render.
+        """
+        if result._summary_markup is not None:
+            return result._summary_markup
+
         buf = StringIO()
         console = Console(file=buf, force_terminal=True, width=100)
 
@@ -109,11 +111,11 @@ class SummaryScreen(Screen):
         table.add_column("Example URL", style="white", min_width=40)
 
         for status, items in sorted(result.findings_by_status.items()):
-            example = items[0].url if items[0].url else "N/A"
-            table.add_row(str(status), str(len(items)), example)
+            table.add_row(str(status), str(len(items)), items[0].url or "N/A")
 
         console.print(table)
-        return buf.getvalue()
+        result._summary_markup = buf.getvalue()
+        return result._summary_markup
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "new-scan-btn":
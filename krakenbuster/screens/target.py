@@ -10,6 +10,15 @@ from textual.containers import Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Header, Input, Label, Static
 
+# Bare domain: dot-separated labels of at most 63 characters, 253 in total.
+# The bounded label form cannot backtrack badly on long or malformed input.
+_DOMAIN_RE = re.compile(
+    r"^(?=.{1,253}$)[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
+)
+_URL_RE = re.compile(r"^https?://[a-zA-Z0-9\-.:]+(?:/.*)?$")
+_URL_SCHEMES = ("http://", "https://")
+
 
 def validate_target(target: str, scan_type: str) -> str | None:
     """Validate the target input. Returns an error message or None if valid."""
@@ -19,18 +28,17 @@ def validate_target(target: str, scan_type: str) -> str | None:
 
     if scan_type == "dns":
         # DNS mode: must be a bare domain with no protocol
-        if target.startswith("http://") or target.startswith("https://"):
+        if target.startswith(_URL_SCHEMES):
             return "DNS mode requires a bare domain without protocol (e.g. example.com)"
         # Basic domain validation
-        if not re.match(r"^[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]*[a-zA-Z0-9])?)*$", target):
+        if not _DOMAIN_RE.match(target):
             return "Invalid domain format"
     else:
         # Directory and vhost modes: must begin with http:// or https://
-        if not (target.startswith("http://") or target.startswith("https://")):
+        if not target.startswith(_URL_SCHEMES):
             return "Target must begin with http:// or https://"
         # Basic URL validation
-        url_pattern = r"^https?://[a-zA-Z0-9\-\.\:]+(/.*)?$"
-        if not re.match(url_pattern, target):
+        if not _URL_RE.match(target):
             return "Invalid URL format"
 
     return None
@@ -8,11 +8,7 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Header, Label, RadioButton, RadioSet, Static
 
-TOOL_SUPPORT = {
-    "directory": ["feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch"],
-    "vhost": ["ffuf", "gobuster", "wfuzz"],
-    "dns": ["gobuster", "amass", "subfinder"],
-}
+from krakenbuster.constants import TOOL_SUPPORT
 
 TOOL_DESCRIPTIONS = {
     "feroxbuster": "Fast, recursive, auto-calibrating, best for thorough directory scans",
@@ -25,6 +21,15 @@ TOOL_DESCRIPTIONS = {
     "subfinder": "Fast passive subdomain discovery using multiple sources",
 }
 
+# (tool, button label, button id) for each scan type, in TOOL_SUPPORT order
+_TOOL_BUTTONS: dict[str, tuple[tuple[str, str, str], ...]] = {
+    scan_type: tuple(
+        (tool, f"{tool}: {TOOL_DESCRIPTIONS.get(tool, '')}", f"tool-{tool}")
+        for tool in tools
+    )
+    for scan_type, tools in TOOL_SUPPORT.items()
+}
+
 
 class ToolSelectScreen(Screen):
     """Screen for selecting the scanning tool."""
@@ -35,6 +40,8 @@ class ToolSelectScreen(Screen):
     ]
 
     _current_index: int = 0
+    _radio: RadioSet | None = None
+    _supported: tuple[str, ...] = ()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -46,16 +53,11 @@ class ToolSelectScreen(Screen):
                 id="tool-select-title",
             )
 
-            supported = TOOL_SUPPORT.get(scan_type, [])
+            available = getattr(self.app, "available_tools", {})
             with RadioSet(id="tool-radio"):
-                for tool in supported:
-                    available = self._is_available(tool)
-                    desc = TOOL_DESCRIPTIONS.get(tool, "")
-                    btn = RadioButton(
-                        f"{tool}: {desc}",
-                        id=f"tool-{tool}",
-                    )
-                    btn.disabled = not available
+                for tool, label, button_id in _TOOL_BUTTONS.get(scan_type, ()):
+                    btn = RadioButton(label, id=button_id)
+                    btn.disabled = not available.get(tool, False)
                     yield btn
 
             yield Label("", id="tool-select-description")
@@ -66,9 +68,11 @@ class ToolSelectScreen(Screen):
                 id="tool-select-hint",
             )
 
-    def _is_available(self, tool: str) -> bool:
-        available = getattr(self.app, "available_tools", {})
-        return available.get(tool, False)
+    def on_mount(self) -> None:
+        """Cache the radio set and the tools it lists for confirmation."""
+        scan_type = getattr(self.app, "scan_type", "directory")
+        self._supported = TOOL_SUPPORT.get(scan_type, ())
+        self._radio = self.query_one("#tool-radio", RadioSet)
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         """Confirm if user re-selected the same option (Enter on current selection)."""
@@ -89,13 +93,9 @@ class ToolSelectScreen(Screen):
         self.app.pop_screen()
 
     def _confirm_selection(self) -> None:
-        scan_type = getattr(self.app, "scan_type", "directory")
-        supported = TOOL_SUPPORT.get(scan_type, [])
-        try:
-            radio = self.query_one("#tool-radio", RadioSet)
-            index = radio.pressed_index
-            if 0 <= index < len(supported):
-                self.app.selected_tool = supported[index]
-                self.app.go_to_target()
-        except Exception:
-            pass
+        if self._radio is None:
+            return
+        index = self._radio.pressed_index
+        if 0 <= index < len(self._supported):
+            self.app.selected_tool = self._supported[index]
+            self.app.go_to_target()
@@ -8,6 +8,8 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Static
 
+from krakenbuster.constants import TOOLS
+
 BANNER = """\
 [bold #88c0d0]
   _  __          _               ____            _
@@ -31,6 +33,10 @@ TOOL_INSTALL_HINTS = {
     "subfinder": "go install -v github.com/projectdiscovery/subfinder/v2/cmd/subfinder@latest",
 }
 
+# Availability markers for the tool status list
+_OK_ICON = "[green]\u2714[/green]"
+_MISSING_ICON = "[red]\u2718[/red]"
+
 
 class WelcomeScreen(Screen):
     """Startup screen showing ASCII banner and tool availability."""
@@ -57,26 +63,18 @@ class WelcomeScreen(Screen):
         available = getattr(app, "available_tools", {})
 
         lines = ["[bold]Tool Availability[/bold]\n"]
-        missing_any = False
-
-        for tool_name in [
-            "feroxbuster", "ffuf", "gobuster", "dirb", "wfuzz", "dirsearch",
-            "amass", "subfinder",
-        ]:
-            is_available = available.get(tool_name, False)
-            if is_available:
-                icon = "[green]\u2714[/green]"
+        hints: list[str] = []
+        for tool_name in TOOLS:
+            if available.get(tool_name, False):
+                lines.append(f"  {_OK_ICON}  {tool_name}")
             else:
-                icon = "[red]\u2718[/red]"
-                missing_any = True
-            lines.append(f"  {icon}  {tool_name}")
+                lines.append(f"  {_MISSING_ICON}  {tool_name}")
+                hints.append(f"  [dim]{TOOL_INSTALL_HINTS[tool_name]}[/dim]")
 
-        if missing_any:
+        if hints:
             lines.append("")
             lines.append("[dim]Install missing tools:[/dim]")
-            for tool_name, hint in TOOL_INSTALL_HINTS.items():
-                if not available.get(tool_name, False):
-                    lines.append(f"  [dim]{hint}[/dim]")
+            lines.extend(hints)
 
         status_widget = self.query_one("#tool-status", Static)
         status_widget.update("\n".join(lines))
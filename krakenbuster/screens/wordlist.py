@@ -9,6 +9,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Header,
@@ -24,11 +25,15 @@ from krakenbuster.wordlist import (
     WordlistFile,
     discover_wordlists,
     get_all_files,
-    human_readable_size,
-    RECOMMENDED,
+    RECOMMENDED_NAMES,
     count_lines,
 )
 
+# The tree is refiltered this long after the last keystroke in the search box
+_FILTER_DEBOUNCE_SECONDS = 0.15
+# A directory with its matching files and matching subdirectories
+_DirMatch = tuple[WordlistDir, list[WordlistFile], list["_DirMatch"]]
+
 
 class WordlistScreen(Screen):
     """Screen for selecting a wordlist file via a hierarchical browser."""
@@ -44,6 +49,12 @@ class WordlistScreen(Screen):
     _selected_path: str = ""
     _manual_mode: bool = False
     _preview_base_lines: list[str] = []
+    _filter_timer: Timer | None = None  # pending debounced tree rebuild
+    _pending_filter: str = ""
+    # Lowercased filter the tree currently shows, or None if it must be rebuilt
+    _shown_filter: str | None = None
+    _leaf_nodes: list[tuple[TreeNode, str]] = []  # (leaf, lowercased file name)
+    _dir_nodes: list[TreeNode] = []  # directory nodes, parents before children
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -75,6 +86,11 @@ class WordlistScreen(Screen):
         """Start async wordlist discovery."""
         manual_input = self.query_one("#wordlist-manual-input", Input)
         manual_input.display = False
+        self._filter_timer = None
+        self._pending_filter = ""
+        self._shown_filter = None
+        self._leaf_nodes = []
+        self._dir_nodes = []
         self.query_one("#wordlist-search", Input).focus()
         self._load_wordlists()
 
@@ -84,102 +100,138 @@ class WordlistScreen(Screen):
 
     async def _discover(self) -> None:
         """Discover wordlists in background."""
-        self._wordlist_dirs = await discover_wordlists()
-        self._all_files = get_all_files(self._wordlist_dirs)
-        self._build_tree()
+        cached = getattr(self.app, "wordlist_cache", None)
+        if cached is None:
+            dirs = await discover_wordlists()
+            cached = (dirs, get_all_files(dirs))
+            self.app.wordlist_cache = cached
+        self._wordlist_dirs, self._all_files = cached
+        # Keep any filter typed while discovery was running
+        self._shown_filter = None
+        self._build_tree(filter_text=self._pending_filter)
 
     def _build_tree(self, filter_text: str = "") -> None:
-        """Build or rebuild the tree widget from discovered wordlists."""
+        """Build or rebuild the tree widget from discovered wordlists.
+
+        When the filter only narrows the one already shown (the user typed
+        more), the existing nodes are pruned instead of rebuilt.
+        """
+        needle = filter_text.lower()
+        shown = self._shown_filter
+        if shown and needle.startswith(shown):
+            self._prune_tree(needle)
+            self._shown_filter = needle
+            return
+
         tree = self.query_one("#wordlist-tree", Tree)
         tree.clear()
         tree.root.expand()
+        self._leaf_nodes = []
+        self._dir_nodes = []
+        self._shown_filter = needle
 
         scan_type = getattr(self.app, "scan_type", "directory")
-        recommended = RECOMMENDED.get(scan_type, [])
+        recommended = RECOMMENDED_NAMES.get(scan_type, frozenset())
 
         for wdir in self._wordlist_dirs:
-            self._add_dir_node(tree.root, wdir, filter_text, recommended)
+            matched = self._match_dir(wdir, needle)
+            if matched is not None:
+                self._add_dir_node(tree.root, matched, filter_text, recommended)
+
+    def _match_dir(self, wdir: WordlistDir, needle: str) -> _DirMatch | None:
+        """Collect the files and subdirectories of a tree that match the filter.
+
+        needle is the lowercased filter text. Each directory is visited once.
+        Returns None if nothing in the tree matches; with no filter,
+        everything matches.
+        """
+        if needle:
+            matching_files = [wf for wf in wdir.files if needle in wf.name_lower]
+        else:
+            matching_files = wdir.files
+        matching_subdirs = []
+        for sub in wdir.subdirs:
+            matched = self._match_dir(sub, needle)
+            if matched is not None:
+                matching_subdirs.append(matched)
+
+        if needle and not matching_files and not matching_subdirs:
+            return None
+        return wdir, matching_files, matching_subdirs
 
     def _add_dir_node(
         self,
         parent: TreeNode,
-        wdir: WordlistDir,
+        matched: _DirMatch,
         filter_text: str,
-        recommended: list[str],
-    ) -> bool:
-        """Add a directory node to the tree. Returns True if any children matched."""
-        has_match = False
-
-        # Check if any files in this dir match
-        matching_files = []
-        for wf in wdir.files:
-            if not filter_text or filter_text.lower() in wf.name.lower():
-                matching_files.append(wf)
-                has_match = True
-
-        # Check subdirectories recursively
-        matching_subdirs = []
-        for sub in wdir.subdirs:
-            if self._dir_has_match(sub, filter_text):
-                matching_subdirs.append(sub)
-                has_match = True
-
-        if not has_match and filter_text:
-            return False
-
+        recommended: frozenset[str],
+    ) -> None:
+        """Add a matched directory and its matching children to the tree."""
+        wdir, matching_files, matching_subdirs = matched
         dir_label = f"{wdir.name} [{wdir.total_count} wordlists]"
         dir_node = parent.add(dir_label, expand=bool(filter_text))
+        self._dir_nodes.append(dir_node)
 
         for wf in matching_files:
-            star = " \u2605" if wf.name in recommended else ""
-            label = f"{wf.name} ({wf.size_human}){star}"
-            dir_node.add_leaf(label, data=str(wf.path))
+            label = wf.label + " \u2605" if wf.name in recommended else wf.label
+            leaf = dir_node.add_leaf(label, data=wf)
+            self._leaf_nodes.append((leaf, wf.name_lower))
 
         for sub in matching_subdirs:
             self._add_dir_node(dir_node, sub, filter_text, recommended)
 
-        return True
-
-    def _dir_has_match(self, wdir: WordlistDir, filter_text: str) -> bool:
-        """Check if any file in the directory tree matches the filter."""
-        if not filter_text:
-            return True
-        for wf in wdir.files:
-            if filter_text.lower() in wf.name.lower():
-                return True
-        for sub in wdir.subdirs:
-            if self._dir_has_match(sub, filter_text):
-                return True
-        return False
+    def _prune_tree(self, needle: str) -> None:
+        """Remove leaves that no longer match, then any emptied directories."""
+        kept_leaves = []
+        for leaf, name_lower in self._leaf_nodes:
+            if needle in name_lower:
+                kept_leaves.append((leaf, name_lower))
+            else:
+                leaf.remove()
+        self._leaf_nodes = kept_leaves
+
+        # Children come after their parents, so walk backwards to empty bottom-up
+        kept_dirs = []
+        for dir_node in reversed(self._dir_nodes):
+            if dir_node.children:
+                kept_dirs.append(dir_node)
+            else:
+                dir_node.remove()
+        kept_dirs.reverse()
+        self._dir_nodes = kept_dirs
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter tree as user types in the search box."""
         if event.input.id == "wordlist-search":
-            self._build_tree(filter_text=event.value)
+            # Collapse a burst of keystrokes into a single rebuild
+            self._pending_filter = event.value
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(
+                _FILTER_DEBOUNCE_SECONDS, self._apply_filter
+            )
+
+    def _apply_filter(self) -> None:
+        """Rebuild the tree for the latest search box text."""
+        self._filter_timer = None
+        self._build_tree(filter_text=self._pending_filter)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Handle selection of a tree node."""
         node = event.node
-        if node.data:
-            self._selected_path = str(node.data)
-            self._update_preview(self._selected_path)
+        if isinstance(node.data, WordlistFile):
+            self._selected_path = node.data.path
+            self._update_preview(node.data)
 
-    def _update_preview(self, path_str: str) -> None:
+    def _update_preview(self, wf: WordlistFile) -> None:
         """Update the preview panel with file information."""
-        path = Path(path_str)
-
         scan_type = getattr(self.app, "scan_type", "directory")
-        recommended = RECOMMENDED.get(scan_type, [])
-        is_rec = path.name in recommended
-
-        try:
-            size = path.stat().st_size
-        except OSError:
-            size = 0
+        recommended = RECOMMENDED_NAMES.get(scan_type, frozenset())
+        is_rec = wf.name in recommended
 
         self._preview_base_lines = [
-            f"[bold]Path:[/bold] {path}",
-            f"[bold]Size:[/bold] {human_readable_size(size)}",
+            f"[bold]Path:[/bold] {wf.path}",
+            f"[bold]Size:[/bold] {wf.size_human}",
         ]
 
         if is_rec:
@@ -190,17 +242,21 @@ class WordlistScreen(Screen):
         preview = self.query_one("#wordlist-preview-content", Static)
         preview.update("\n".join(self._preview_base_lines + ["[dim]Counting lines...[/dim]"]))
 
-        # Count lines in background
-        self.run_worker(self._count_and_update(path_str))
+        # Count lines in background (count_lines remembers unchanged files)
+        self.run_worker(self._count_and_update(wf.path))
 
     async def _count_and_update(self, path_str: str) -> None:
         """Count lines and update the preview."""
         path = Path(path_str)
         line_count = await count_lines(path)
         if self._selected_path == path_str:
-            preview = self.query_one("#wordlist-preview-content", Static)
-            lines = self._preview_base_lines + [f"[bold]Lines:[/bold] {line_count:,}"]
-            preview.update("\n".join(lines))
+            self._show_line_count(line_count)
+
+    def _show_line_count(self, line_count: int) -> None:
+        """Show the preview for the selected file, with its line count."""
+        preview = self.query_one("#wordlist-preview-content", Static)
+        lines = self._preview_base_lines + [f"[bold]Lines:[/bold] {line_count:,}"]
+        preview.update("\n".join(lines))
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle manual path submission."""
@@ -0,0 +1,17 @@
+"""Detection of the external scanning tools installed on the system."""
+
+from __future__ import annotations
+
+import functools
+import shutil
+
+from krakenbuster.constants import TOOLS
+
+
+@functools.lru_cache(maxsize=1)
+def check_tools() -> dict[str, bool]:
+    """Check which tools are available on the system.
+
+    The PATH lookup is done once per process; later calls reuse the result.
+    """
+    return {tool: shutil.which(tool) is not None for tool in TOOLS}
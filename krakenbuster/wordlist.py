@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -26,6 +28,17 @@ RECOMMENDED = {
     ],
 }
 
+# RECOMMENDED as sets, for membership checks
+RECOMMENDED_NAMES: dict[str, frozenset[str]] = {
+    scan_type: frozenset(names) for scan_type, names in RECOMMENDED.items()
+}
+
+# Read size when counting lines; large enough that bytes.count dominates
+_COUNT_CHUNK_BYTES = 1 << 20
+
+# Line counts keyed by (path, size, mtime_ns), so an edited file is recounted
+_LINE_COUNTS: dict[tuple[str, int, int], int] = {}
+
 
 def human_readable_size(size_bytes: int) -> str:
     """Convert byte count to human-readable string."""
@@ -39,34 +52,42 @@ def human_readable_size(size_bytes: int) -> str:
         return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
 
 
-@dataclass
+# WordlistFile size when the caller didn't know it; 0 is a real, empty file
+_SIZE_UNKNOWN = -1
+
+
+@dataclass(slots=True)
 class WordlistFile:
     """A single wordlist file."""
 
-    path: Path
-    size: int = 0
+    # Kept as a plain string: it is only displayed and passed to the tools
+    path: str
+    size: int = _SIZE_UNKNOWN
     name: str = ""
+    # Lowercased name, for case-insensitive filtering
+    name_lower: str = field(default="", init=False, repr=False, compare=False)
+    # Formatted size and the "name (size)" tree label, fixed once size is known
+    size_human: str = field(default="", init=False, repr=False, compare=False)
+    label: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.name:
-            self.name = self.path.name
-        if self.size == 0 and self.path.exists():
+            self.name = os.path.basename(self.path)
+        self.name_lower = self.name.lower()
+        if self.size == _SIZE_UNKNOWN:
             try:
-                self.size = self.path.stat().st_size
+                self.size = os.stat(self.path).st_size
             except OSError:
-                pass
-
-    @property
-    def size_human(self) -> str:
-        return human_readable_size(self.size)
+                self.size = 0
+        self.size_human = human_readable_size(self.size)
+        self.label = f"{self.name} ({self.size_human})"
 
     def is_recommended(self, scan_type: str) -> bool:
         """Check if this wordlist is recommended for the given scan type."""
-        recommended_names = RECOMMENDED.get(scan_type, [])
-        return self.name in recommended_names
+        return self.name in RECOMMENDED_NAMES.get(scan_type, frozenset())
 
 
-@dataclass
+@dataclass(slots=True)
 class WordlistDir:
     """A directory containing wordlists, possibly with subdirectories."""
 
@@ -74,44 +95,59 @@ class WordlistDir:
     name: str = ""
     files: list[WordlistFile] = field(default_factory=list)
     subdirs: list[WordlistDir] = field(default_factory=list)
+    # Wordlist files in this directory and all subdirectories, filled in by
+    # the scan once the directory is complete
+    total_count: int = 0
 
     def __post_init__(self) -> None:
         if not self.name:
             self.name = self.path.name
 
-    @property
-    def total_count(self) -> int:
-        """Total number of wordlist files in this directory and all subdirectories."""
-        count = len(self.files)
-        for subdir in self.subdirs:
-            count += subdir.total_count
-        return count
 
+def _scan_directory(
+    base_path: Path, visited: set[tuple[int, int]] | None = None
+) -> WordlistDir | None:
+    """Scan a directory for wordlist files, building a tree structure.
 
-def _scan_directory(base_path: Path) -> WordlistDir | None:
-    """Scan a directory for wordlist files, building a tree structure."""
-    if not base_path.exists() or not base_path.is_dir():
+    visited holds the (device, inode) of every directory scanned so far, so
+    a tree reached again through a symlink is skipped instead of repeated.
+    """
+    try:
+        st = base_path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
         return None
+    if visited is None:
+        visited = set()
+    key = (st.st_dev, st.st_ino)
+    if key in visited:
+        return None
+    visited.add(key)
 
     root = WordlistDir(path=base_path, name=base_path.name)
 
+    # DirEntry answers is_file/is_dir from the directory listing itself and
+    # caches its stat, so each entry costs at most one syscall
     try:
-        entries = sorted(base_path.iterdir())
+        with os.scandir(base_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
     except PermissionError:
         return root
 
     for entry in entries:
-        if entry.is_file() and entry.suffix == ".txt":
+        if entry.is_file() and entry.name.endswith(".txt"):
             try:
-                wf = WordlistFile(path=entry, size=entry.stat().st_size)
+                wf = WordlistFile(path=entry.path, size=entry.stat().st_size)
                 root.files.append(wf)
             except (OSError, PermissionError):
                 pass
         elif entry.is_dir():
-            subdir = _scan_directory(entry)
+            subdir = _scan_directory(Path(entry.path), visited)
             if subdir and subdir.total_count > 0:
                 root.subdirs.append(subdir)
 
+    root.total_count = len(root.files) + sum(s.total_count for s in root.subdirs)
     return root
 
 
@@ -121,8 +157,9 @@ async def discover_wordlists() -> list[WordlistDir]:
 
     def _scan_all() -> list[WordlistDir]:
         dirs = []
+        visited: set[tuple[int, int]] = set()
         for base in WORDLIST_DIRS:
-            result = _scan_directory(base)
+            result = _scan_directory(base, visited)
             if result and result.total_count > 0:
                 dirs.append(result)
         return dirs
@@ -132,16 +169,45 @@ async def discover_wordlists() -> list[WordlistDir]:
 
 
 async def count_lines(wordlist_path: Path) -> int:
-    """Count lines in a wordlist file without blocking."""
+    """Count lines in a wordlist file without blocking.
+
+    Counts are remembered for the session until the file's size or mtime
+    changes, so the preview and the scan share one pass over the file.
+    """
 
     def _count() -> int:
+        key: tuple[str, int, int] | None = None
+        try:
+            st = os.stat(wordlist_path)
+            key = (os.fspath(wordlist_path), st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+        cached = _LINE_COUNTS.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+
         count = 0
+        last = b"\n"
         try:
-            with open(wordlist_path, "r", errors="ignore") as fh:
-                for _ in fh:
-                    count += 1
+            with open(wordlist_path, "rb") as fh:
+                if hasattr(os, "posix_fadvise"):
+                    # One front-to-back pass: let the kernel read ahead further
+                    os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while chunk := fh.read(_COUNT_CHUNK_BYTES):
+                    newlines = chunk.count(b"\n")
+                    if not newlines:
+                        # Lines ended by a bare CR (old Mac, some tools)
+                        newlines = chunk.count(b"\r")
+                    count += newlines
+                    last = chunk[-1:]
         except (OSError, PermissionError):
-            pass
+            # Don't remember a count from a read that failed part-way
+            key = None
+        # A final line without a trailing newline still counts
+        if last not in (b"\n", b"\r"):
+            count += 1
+        if key is not None:
+            _LINE_COUNTS[key] = count
         return count
 
     return await asyncio.to_thread(_count)